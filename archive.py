@@ -51,7 +51,8 @@ class U8(WiiArchive):
 		
 		nodes = []
 		strings = b'\x00'
-		data = b''
+		data = [] # (offset, value) pairs, copied into place at the end
+		data_size = 0
 		
 		for item, value in self.files:
 			node = self.U8Node()
@@ -74,8 +75,9 @@ class U8(WiiArchive):
 						node.size += 1
 			else: # file
 				node.type = 0x0000
-				node.data_offset = len(data)
-				data += value + (b'\x00' * (align(len(value), 32) - len(value))) # 32 seems to work best for fuzzyness? I'm still really not sure
+				node.data_offset = data_size
+				data.append((data_size, value))
+				data_size += align(len(value), 32) # 32 seems to work best for fuzzyness? I'm still really not sure
 				node.size = len(value)
 			nodes.append(node)
 			
@@ -87,16 +89,15 @@ class U8(WiiArchive):
 			if(nodes[i].type == 0x0000):
 				nodes[i].data_offset += header.data_offset
 						
-		fd = b''
-		fd += header.pack()
-		fd += rootnode.pack()
-		for node in nodes:
-			fd += node.pack()
-		fd += strings
-		fd += b'\x00' * (header.data_offset - header.rootnode_offset - header.header_size)
-		fd += data
+		# Build the whole archive in one preallocated buffer
+		fd = bytearray(header.data_offset + data_size)
+		headerdata = b''.join([header.pack(), rootnode.pack()] + [node.pack() for node in nodes] + [strings])
+		fd[:len(headerdata)] = headerdata
+		for offset, value in data:
+			offset += header.data_offset
+			fd[offset : offset + len(value)] = value
 		
-		return fd
+		return bytes(fd)
 
 	def _dumpDir(self, dir):
 		if not os.path.isdir(dir):
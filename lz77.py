@@ -1,5 +1,109 @@
 import struct
-import ctypes
+
+# Set this to True to decompress with a Numba-compiled loop (Puzzle's
+# -numba option does this). It's off by default because the first
+# decompression then has to compile it, which takes a while.
+UseNumba = False
+
+# Numba and NumPy take a while to import, so they're only loaded the
+# first time something is decompressed (see _getCompiledDecompressor())
+numba = None
+np = None
+_compiledDecompress11LZS = None
+
+
+def _getCompiledDecompressor():
+    """
+    Returns the Numba-compiled version of _decompress11LZS(), importing
+    Numba and NumPy on the first call. Returns None if UseNumba is
+    off or they aren't installed.
+    """
+    global numba, np, _compiledDecompress11LZS
+    if not UseNumba:
+        return None
+    if _compiledDecompress11LZS is None:
+        try:
+            import numba
+            import numpy as np
+        except ImportError:
+            _compiledDecompress11LZS = False
+        else:
+            _compiledDecompress11LZS = numba.njit(cache=True)(_decompress11LZS)
+    return _compiledDecompress11LZS or None
+
+
+def _decompress11LZS(filein, offset, outdata):
+    """
+    Main loop of LZS11.Decompress11LZS(), compiled with Numba.
+    Decompresses filein[offset:] into outdata, which should be
+    preallocated to the decompressed size, and returns the number
+    of bytes written. Malformed data is handled the same way as in the
+    pure-Python loop: truncated input raises IndexError, and a
+    back-reference to before the start of the output raises ValueError.
+    """
+    decomp_size = len(outdata)
+    lenFileIn = len(filein)
+    curr_size = 0
+
+    while curr_size < decomp_size and offset < lenFileIn:
+        flags = filein[offset]
+        offset += 1
+
+        for x in range(7, -1, -1):
+            if curr_size >= decomp_size:
+                break
+            if flags & (1 << x):
+                if offset + 2 > lenFileIn:
+                    raise IndexError('LZ77 data ended unexpectedly')
+                first = filein[offset]
+                second = filein[offset + 1]
+                offset += 2
+
+                if first < 0x20:
+                    if offset + 1 > lenFileIn:
+                        raise IndexError('LZ77 data ended unexpectedly')
+                    third = filein[offset]
+                    offset += 1
+
+                    if first >= 0x10:
+                        if offset + 1 > lenFileIn:
+                            raise IndexError('LZ77 data ended unexpectedly')
+                        fourth = filein[offset]
+                        offset += 1
+
+                        pos = (((third & 0xF) << 8) | fourth) + 1
+                        copylen = ((second << 4) | ((first & 0xF) << 12) | (third >> 4)) + 273
+                    else:
+                        pos = (((second & 0xF) << 8) | third) + 1
+                        copylen = (((first & 0xF) << 4) | (second >> 4)) + 17
+                else:
+                    pos = (((first & 0xF) << 8) | second) + 1
+                    copylen = (first >> 4) + 1
+
+                if pos > curr_size:
+                    raise ValueError('LZ77 data refers to data before the start of the output')
+                if copylen > decomp_size - curr_size:
+                    copylen = decomp_size - curr_size
+
+                # Byte by byte, since the source and destination can
+                # overlap (that's how runs are encoded)
+                src = curr_size - pos
+                for i in range(copylen):
+                    outdata[curr_size + i] = outdata[src + i]
+
+                curr_size += copylen
+            else:
+                if offset >= lenFileIn:
+                    raise IndexError('LZ77 data ended unexpectedly')
+                outdata[curr_size] = filein[offset]
+                offset += 1
+                curr_size += 1
+
+            if offset >= lenFileIn or curr_size >= decomp_size:
+                break
+
+    return curr_size
+
 
 class LZS11(object):
     def __init__(self):
@@ -27,6 +131,15 @@ class LZS11(object):
         # assert decomp_size <= 0x200000 << 8
 
         #print("Decompressing 0x%x. (outsize: 0x%x)" % (len(filein), decomp_size))
+        compiledDecompress = _getCompiledDecompressor()
+        if compiledDecompress is not None:
+            outdata = bytearray(decomp_size)
+            self.curr_size = compiledDecompress(
+                np.frombuffer(filein, dtype=np.uint8), offset,
+                np.frombuffer(outdata, dtype=np.uint8))
+            self.outdata = outdata
+            return outdata
+
         outdata = bytearray()
         curr_size = 0
         lenFileIn = len(filein)
@@ -62,6 +175,9 @@ class LZS11(object):
                         pos = (((first & 0xF) << 8) | second) + 1
                         copylen = (first >> 4) + 1
 
+                    if pos > curr_size:
+                        raise ValueError('LZ77 data refers to data before the start of the output')
+
                     # We need to append as many copies of copyBuf as it
                     # takes to reach copylen, but no more. This is the
                     # absolute fastest way of doing that that I've
@@ -91,6 +207,12 @@ class LZS11(object):
                 if offset >= len(filein) or curr_size >= decomp_size:
                     break
 
+        # If the last back-reference ran past the decompressed size,
+        # drop the excess, like the compiled loop and nsmblib do
+        if curr_size > decomp_size:
+            del outdata[decomp_size:]
+            curr_size = decomp_size
+
         if len(outdata) < decomp_size:
             outdata.extend(bytes(decomp_size - len(outdata)))
 
@@ -1,10 +1,43 @@
+"""
+Development tool for the function Puzzle uses to fix the colors of
+fully-transparent pixels around the edges of tiles.
+
+Without NumPy, Puzzle runs color_transparent_pixels_around_edges_24_24(),
+whose source code is generated by make_function() below and pasted into
+puzzle.py. Nothing is generated or exec()'d at runtime, so after
+changing make_function(), regenerate that function and replace it in
+puzzle.py.
+
+The other implementations here work for any image size, and are used to
+check the generated code's output and speed: a simple reference
+implementation, plus NumPy and Numba ones (a single compiled kernel
+shared by all image sizes) if those libraries are installed. Puzzle has
+a copy of the NumPy one, which it uses instead of the generated function
+when NumPy is installed; it doesn't depend on Numba.
+"""
+
 import random
 import textwrap
 import timeit
-from typing import Union
+from typing import Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 StrOrInt = Union[str, int]
 
+# Images with rows wider than this (in bytes) have their main body
+# processed in vertical strips of STRIP_WIDTH pixels; see make_function()
+L1_CACHE_SIZE = 0xC000
+STRIP_WIDTH = 64
+
 
 
 def color_transparent_pixels_around_edges(data: bytearray, w: int, h: int) -> None:
@@ -22,12 +55,16 @@ def color_transparent_pixels_around_edges(data: bytearray, w: int, h: int) -> No
     if len(data) != w * h * 4:
         raise ValueError(f'expected {w * h * 4:#x} bytes, got {len(data):#x}')
 
+    # Byte offsets of the start of each row and each column
+    row_offsets = [y * w * 4 for y in range(h)]
+    col_offsets = [x * 4 for x in range(w)]
+
     for y in range(h):
         for x in range(w):
-            offs = (y * w + x) * 4
+            offs = row_offsets[y] + col_offsets[x]
 
             if data[offs + 3] == 0:
-                neighbors = []
+                b = g = r = count = 0
 
                 for x2, y2 in [
                         (x, y - 1),
@@ -39,16 +76,128 @@ def color_transparent_pixels_around_edges(data: bytearray, w: int, h: int) -> No
                         (x - 1, y),
                         (x - 1, y - 1)]:
                     if 0 <= x2 < w and 0 <= y2 < h:
-                        offs2 = ((y2 * w) + x2) * 4
+                        offs2 = row_offsets[y2] + col_offsets[x2]
                         if data[offs2 + 3]:
-                            neighbors.append(data[offs2 : offs2 + 3])
+                            b += data[offs2]
+                            g += data[offs2 + 1]
+                            r += data[offs2 + 2]
+                            count += 1
 
-                if neighbors:
+                if count:
                     # Calculate average R/G/B values of our neighbors,
                     # and update our own to match
-                    data[offs    ] = sum(n[0] for n in neighbors) // len(neighbors)
-                    data[offs + 1] = sum(n[1] for n in neighbors) // len(neighbors)
-                    data[offs + 2] = sum(n[2] for n in neighbors) // len(neighbors)
+                    data[offs    ] = b // count
+                    data[offs + 1] = g // count
+                    data[offs + 2] = r // count
+
+
+
+def color_transparent_pixels_around_edges_numpy(data: bytearray, w: int, h: int) -> None:
+    """
+    Same as color_transparent_pixels_around_edges(), but implemented
+    with NumPy. Rather than visiting one pixel at a time, this adds up
+    the RGB values and the counts of all pixels' non-fully-transparent
+    neighbors at once, as a 3x3 box sum. The box sum is separable, so
+    it's done as a horizontal 3-wide sum followed by a vertical one
+    (four shifted-slice additions instead of eight), and then the
+    center pixel is subtracted back out.
+
+    Puzzle has a copy of this, which it uses when NumPy is installed, so
+    keep the two in sync.
+    """
+    if not data or len(data) % (w * h * 4):
+        raise ValueError(f'expected a multiple of {w * h * 4:#x} bytes, got {len(data):#x}')
+
+    # This is a view of "data", so writing to it updates "data". The
+    # first axis is for when "data" holds several images.
+    arr = np.frombuffer(data, dtype=np.uint8).reshape(-1, h, w, 4)
+
+    opaque = (arr[..., 3] != 0).astype(np.uint16)
+
+    # Split the interleaved BGR channels into three separate contiguous
+    # planes, so that every shifted-slice addition below runs over
+    # unit-stride memory. The RGB values are stacked on top of the
+    # opaque-pixel counts as a fourth plane, so that both get summed
+    # together.
+    planes = np.empty((4,) + opaque.shape, dtype=np.uint16)
+    planes[:3] = np.moveaxis(arr[..., :3], -1, 0)
+    planes[:3] *= opaque
+    planes[3] = opaque
+
+    # Horizontal pass: each pixel plus its left and right neighbors
+    rows = planes.copy()
+    rows[..., 1:] += planes[..., :-1]
+    rows[..., :-1] += planes[..., 1:]
+
+    # Vertical pass over that: the full 3x3 box around each pixel
+    box = rows.copy()
+    box[..., 1:, :] += rows[..., :-1, :]
+    box[..., :-1, :] += rows[..., 1:, :]
+
+    # Only the 8 neighbors should count, not the pixel itself
+    box -= planes
+    sums, counts = box[:3], box[3]
+
+    mask = (opaque == 0) & (counts != 0)
+    masked_counts = counts[mask]
+    for channel in range(3):
+        arr[..., channel][mask] = sums[channel][mask] // masked_counts
+
+
+
+if numba is not None:
+    # The explicit signature makes Numba compile this immediately, once,
+    # rather than on the first call. It's then reused for every image
+    # size.
+    @numba.njit('void(uint32[:, ::1])', parallel=True, cache=True)
+    def _color_transparent_pixels_around_edges_kernel(pixels):
+        h, w = pixels.shape
+
+        # Each pixel is one 0xAARRGGBB integer, so "p > 0xffffff" means
+        # "pixel p isn't fully transparent". Masking with 0xff00ff
+        # leaves R and B in separate 16-bit lanes, which can be summed
+        # together (8 * 0xff doesn't overflow a lane), so a neighbor
+        # only takes two additions instead of three.
+
+        # Rows can be processed in parallel: only fully-transparent
+        # pixels are written, they stay fully transparent, and those
+        # aren't counted as neighbors
+        for y in numba.prange(h):
+            for x in range(w):
+                if pixels[y, x] <= 0xffffff:
+                    rb = g = n = 0
+
+                    # (This includes the pixel itself, but it's
+                    # transparent, so it won't be counted.) Multiplying
+                    # by m instead of testing it keeps this loop free of
+                    # unpredictable branches.
+                    for y2 in range(max(y - 1, 0), min(y + 2, h)):
+                        for x2 in range(max(x - 1, 0), min(x + 2, w)):
+                            p = pixels[y2, x2]
+                            m = p > 0xffffff
+                            rb += (p & 0xff00ff) * m
+                            g += (p & 0xff00) * m
+                            n += m
+
+                    if n:
+                        pixels[y, x] = (((rb >> 16) // n) << 16
+                                        | ((g >> 8) // n) << 8
+                                        | (rb & 0xffff) // n)
+
+
+    def color_transparent_pixels_around_edges_numba(data: bytearray, w: int, h: int) -> None:
+        """
+        Same as color_transparent_pixels_around_edges(), but compiled to
+        native code with Numba, with rows split across threads.
+
+        Puzzle doesn't use this one; it's only used for comparison.
+        """
+        if len(data) != w * h * 4:
+            raise ValueError(f'expected {w * h * 4:#x} bytes, got {len(data):#x}')
+
+        # (BGRA8 bytes are 0xAARRGGBB as little-endian uint32s)
+        _color_transparent_pixels_around_edges_kernel(
+            np.frombuffer(data, dtype='<u4').reshape(h, w))
 
 
 
@@ -56,6 +205,9 @@ def make_function(w: int, h: int) -> str:
     """
     Build source code for a "color_transparent_pixels_around_edges"
     function optimized for a specific image size.
+
+    This is only meant to be run during development; see the module
+    docstring.
     """
     if w < 2 or h < 2:
         raise ValueError
@@ -81,33 +233,109 @@ def make_function(w: int, h: int) -> str:
     def get_offs(x: int, y: int) -> int:
         return y * stride + x * 4
 
-    def add_neighbor(name: str, pixel_offset: StrOrInt, alpha_offset: StrOrInt, extra_cmd: str = '', *, indent: int = 0) -> str:
-        if extra_cmd:
-            extra_cmd += '\n'
+    # Note: the generated code indexes the bytearray directly, one byte
+    # at a time. Viewing it as one uint32 per pixel instead
+    # (memoryview(data).cast('I')) needs fewer indexing operations, but
+    # on CPython it's measurably slower overall: indexing a memoryview
+    # is slower than indexing a bytearray, and the pixel values are too
+    # large to be cached small ints, so every read allocates an int
+    # object and then needs masks and shifts to split it up again.
+    def add_neighbor(name: str, pixel_offset: Union[int, Tuple[str, str, str]], alpha_offset: StrOrInt, *, indent: int = 0) -> str:
+        if isinstance(pixel_offset, int):
+            pixel_offset = (pixel_offset, pixel_offset + 1, pixel_offset + 2)
+        b_offs, g_offs, r_offs = (hexs(o) for o in pixel_offset)
         return textwrap.indent(f'''
 # {name}
-{extra_cmd}if data[{hexs(alpha_offset)}]:
-    neighbors.append(data[{hexs(pixel_offset)} : {hexs(alpha_offset)}])
+if data[{hexs(alpha_offset)}]:
+    b += data[{b_offs}]
+    g += data[{g_offs}]
+    r += data[{r_offs}]
+    n += 1
 '''.strip('\n'), ' ' * indent)
 
-    def add_relative_neighbor(name: str, offset_delta: int, *, indent: int = 0) -> str:
+    def relative(offset_delta: int) -> str:
         if offset_delta > 0:
-            extra_cmd = f'offset += {offset_delta:#x}'
-        else:
-            extra_cmd = f'offset -= {-offset_delta:#x}'
-        return add_neighbor(name, 'offset - 3', 'offset', extra_cmd, indent=indent)
-
-    def add_epilogue(idx_1: StrOrInt, idx_2: StrOrInt, idx_3: StrOrInt, extra_cmd: str = '', *, indent: int = 0) -> str:
-        if extra_cmd:
-            extra_cmd += '\n    '
+            return f'offset + {offset_delta:#x}'
+        elif offset_delta < 0:
+            return f'offset - {-offset_delta:#x}'
+        return 'offset'
+
+    def add_relative_neighbor(name: str, offset_delta: int, *, indent: int = 0) -> str:
+        # "offset" is the alpha byte of the pixel being processed, so
+        # every neighbor is at a constant offset from it
+        return add_neighbor(
+            name,
+            (relative(offset_delta - 3), relative(offset_delta - 2), relative(offset_delta - 1)),
+            relative(offset_delta),
+            indent=indent)
+
+    def add_epilogue(idx_1: StrOrInt, idx_2: StrOrInt, idx_3: StrOrInt, *, indent: int = 0) -> str:
         return textwrap.indent(f'''
-if neighbors:
-    {extra_cmd}ln = len_loc(neighbors)
-    data[{hexs(idx_1)}] = sum_loc(n[0] for n in neighbors) // ln
-    data[{hexs(idx_2)}] = sum_loc(n[1] for n in neighbors) // ln
-    data[{hexs(idx_3)}] = sum_loc(n[2] for n in neighbors) // ln
+if n:
+    data[{hexs(idx_1)}] = b // n
+    data[{hexs(idx_2)}] = g // n
+    data[{hexs(idx_3)}] = r // n
 '''.strip('\n'), ' ' * indent)
 
+    def add_main_body_pixel(*, indent: int = 0) -> str:
+        return textwrap.indent(f'''
+if not data[offset]:  # (fully transparent pixel)
+    b = g = r = n = 0
+
+{add_relative_neighbor('(x, y - 1)', up, indent=4)}
+
+{add_relative_neighbor('(x + 1, y - 1)', up + right, indent=4)}
+
+{add_relative_neighbor('(x + 1, y)', right, indent=4)}
+
+{add_relative_neighbor('(x + 1, y + 1)', down + right, indent=4)}
+
+{add_relative_neighbor('(x, y + 1)', down, indent=4)}
+
+{add_relative_neighbor('(x - 1, y + 1)', down + left, indent=4)}
+
+{add_relative_neighbor('(x - 1, y)', left, indent=4)}
+
+{add_relative_neighbor('(x - 1, y - 1)', up + left, indent=4)}
+
+{add_epilogue('offset - 3', 'offset - 2', 'offset - 1', indent=4)}
+'''.strip('\n'), ' ' * indent)
+
+    # Note: jumping straight from one fully transparent pixel to the next
+    # with bytearray.find() instead of testing every pixel in the row was
+    # tried. It's ~15% faster for rows with only a few such pixels, but
+    # ~10% slower for rows with many of them (which are the ones left
+    # over after the row checks below), so it isn't worth it overall.
+    if stride * 3 <= L1_CACHE_SIZE:
+        main_body = f'''
+    for row_start_offs in range_loc({get_offs(1, 1) + 3:#x}, {get_offs(1, h - 1) + 3:#x}, {down:#x}):
+        if 0 not in data[row_start_offs : row_start_offs + {stride - 8:#x} : 4]:
+            continue  # (no fully transparent pixels in this row)
+        if data[row_start_offs - {stride + 4:#x} : row_start_offs + {stride * 2 - 4:#x} : 4].count(0) == {w * 3:#x}:
+            continue  # (no non-fully-transparent pixels in this row or the ones around it)
+
+        for offset in range_loc(row_start_offs, row_start_offs + {stride - 8:#x}, {right:#x}):
+{add_main_body_pixel(indent=12)}
+'''.strip('\n')
+    else:
+        # Each pixel reads the rows above and below it, which would
+        # already have been evicted from the cache by the time the next
+        # row needs them again if we scanned full rows of a wide image.
+        # So instead, process it in vertical strips narrow enough for
+        # three rows of the strip to fit in the cache.
+        strips = ', '.join(
+            f'({get_offs(x, 1) + 3:#x}, {min(STRIP_WIDTH, w - 1 - x) * 4:#x})'
+            for x in range(1, w - 1, STRIP_WIDTH))
+        main_body = f'''
+    for strip_offs, strip_width in ({strips},):
+        for row_start_offs in range_loc(strip_offs, strip_offs + {stride * (h - 2):#x}, {down:#x}):
+            if 0 not in data[row_start_offs : row_start_offs + strip_width : 4]:
+                continue  # (no fully transparent pixels in this row of the strip)
+
+            for offset in range_loc(row_start_offs, row_start_offs + strip_width, {right:#x}):
+{add_main_body_pixel(indent=16)}
+'''.strip('\n')
+
     return f'''
 def color_transparent_pixels_around_edges_{w}_{h}(data: bytearray) -> None:
     """
@@ -124,14 +352,18 @@ def color_transparent_pixels_around_edges_{w}_{h}(data: bytearray) -> None:
     if len(data) != {end:#x}:
         raise ValueError(f'expected {end:#x} bytes, got {{len(data):#x}}')
 
-    # Redefine some globals as locals for faster lookups
-    sum_loc, len_loc, range_loc = sum, len, range
+    # Nothing to do if there aren't any fully transparent pixels
+    if 0 not in data[3::4]:
+        return
+
+    # Redefine a global as a local for faster lookups
+    range_loc = range
 
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Top-left corner
 
     if not data[{get_offs(0, 0) + 3:#x}]:
-        neighbors = []
+        b = g = r = n = 0
 
 {add_neighbor('(x + 1, y)', get_offs(1, 0), get_offs(1, 0) + 3, indent=8)}
 
@@ -145,7 +377,7 @@ def color_transparent_pixels_around_edges_{w}_{h}(data: bytearray) -> None:
     # Top-right corner
 
     if not data[{get_offs(w - 1, 0) + 3:#x}]:
-        neighbors = []
+        b = g = r = n = 0
 
 {add_neighbor('(x, y + 1)', get_offs(w - 1, 1), get_offs(w - 1, 1) + 3, indent=8)}
 
@@ -159,7 +391,7 @@ def color_transparent_pixels_around_edges_{w}_{h}(data: bytearray) -> None:
     # Bottom-left corner
 
     if not data[{get_offs(0, h - 1) + 3:#x}]:
-        neighbors = []
+        b = g = r = n = 0
 
 {add_neighbor('(x, y - 1)', get_offs(0, h - 2), get_offs(0, h - 2) + 3, indent=8)}
 
@@ -173,7 +405,7 @@ def color_transparent_pixels_around_edges_{w}_{h}(data: bytearray) -> None:
     # Bottom-right corner
 
     if not data[{get_offs(w - 1, h - 1) + 3:#x}]:
-        neighbors = []
+        b = g = r = n = 0
 
 {add_neighbor('(x - 1, y)', get_offs(w - 2, h - 1), get_offs(w - 2, h - 1) + 3, indent=8)}
 
@@ -188,102 +420,81 @@ def color_transparent_pixels_around_edges_{w}_{h}(data: bytearray) -> None:
 
     for offset in range_loc({get_offs(1, 0) + 3:#x}, {get_offs(w - 1, 0) + 3:#x}, {right:#x}):
         if not data[offset]:
-            neighbors = []
+            b = g = r = n = 0
 
 {add_relative_neighbor('(x + 1, y)', right, indent=12)}
 
-{add_relative_neighbor('(x + 1, y + 1)', down, indent=12)}
+{add_relative_neighbor('(x + 1, y + 1)', down + right, indent=12)}
 
-{add_relative_neighbor('(x, y + 1)', left, indent=12)}
+{add_relative_neighbor('(x, y + 1)', down, indent=12)}
 
-{add_relative_neighbor('(x - 1, y + 1)', left, indent=12)}
+{add_relative_neighbor('(x - 1, y + 1)', down + left, indent=12)}
 
-{add_relative_neighbor('(x - 1, y)', up, indent=12)}
+{add_relative_neighbor('(x - 1, y)', left, indent=12)}
 
-{add_epilogue('offset + 1', 'offset + 2', 'offset + 3', indent=12)}
+{add_epilogue('offset - 3', 'offset - 2', 'offset - 1', indent=12)}
 
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Bottom edge, except corners
 
     for offset in range_loc({get_offs(1, h - 1) + 3:#x}, {get_offs(w - 1, h - 1) + 3:#x}, {right:#x}):
         if not data[offset]:
-            neighbors = []
+            b = g = r = n = 0
 
 {add_relative_neighbor('(x - 1, y)', left, indent=12)}
 
-{add_relative_neighbor('(x - 1, y - 1)', up, indent=12)}
+{add_relative_neighbor('(x - 1, y - 1)', up + left, indent=12)}
 
-{add_relative_neighbor('(x, y - 1)', right, indent=12)}
+{add_relative_neighbor('(x, y - 1)', up, indent=12)}
 
-{add_relative_neighbor('(x + 1, y - 1)', right, indent=12)}
+{add_relative_neighbor('(x + 1, y - 1)', up + right, indent=12)}
 
-{add_relative_neighbor('(x + 1, y)', down, indent=12)}
+{add_relative_neighbor('(x + 1, y)', right, indent=12)}
 
-{add_epilogue('offset - 7', 'offset - 6', 'offset - 5', indent=12)}
+{add_epilogue('offset - 3', 'offset - 2', 'offset - 1', indent=12)}
 
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Left edge, except corners
 
     for offset in range_loc({get_offs(0, 1) + 3:#x}, {get_offs(0, h - 1) + 3:#x}, {down:#x}):
         if not data[offset]:
-            neighbors = []
+            b = g = r = n = 0
 
 {add_relative_neighbor('(x, y - 1)', up, indent=12)}
 
-{add_relative_neighbor('(x + 1, y - 1)', right, indent=12)}
+{add_relative_neighbor('(x + 1, y - 1)', up + right, indent=12)}
 
-{add_relative_neighbor('(x + 1, y)', down, indent=12)}
+{add_relative_neighbor('(x + 1, y)', right, indent=12)}
 
-{add_relative_neighbor('(x + 1, y + 1)', down, indent=12)}
+{add_relative_neighbor('(x + 1, y + 1)', down + right, indent=12)}
 
-{add_relative_neighbor('(x, y + 1)', left, indent=12)}
+{add_relative_neighbor('(x, y + 1)', down, indent=12)}
 
-{add_epilogue('offset', 'offset + 1', 'offset + 2', f'offset -= {stride + 3:#x}', indent=12)}
+{add_epilogue('offset - 3', 'offset - 2', 'offset - 1', indent=12)}
 
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Right edge, except corners
 
     for offset in range_loc({get_offs(w - 1, 1) + 3:#x}, {get_offs(w - 1, h - 1) + 3:#x}, {down:#x}):
         if not data[offset]:
-            neighbors = []
+            b = g = r = n = 0
 
 {add_relative_neighbor('(x, y + 1)', down, indent=12)}
 
-{add_relative_neighbor('(x - 1, y + 1)', left, indent=12)}
+{add_relative_neighbor('(x - 1, y + 1)', down + left, indent=12)}
 
-{add_relative_neighbor('(x - 1, y)', up, indent=12)}
+{add_relative_neighbor('(x - 1, y)', left, indent=12)}
 
-{add_relative_neighbor('(x - 1, y - 1)', up, indent=12)}
+{add_relative_neighbor('(x - 1, y - 1)', up + left, indent=12)}
 
-{add_relative_neighbor('(x, y - 1)', right, indent=12)}
+{add_relative_neighbor('(x, y - 1)', up, indent=12)}
 
-{add_epilogue('offset', 'offset + 1', 'offset + 2', f'offset += {stride - 3:#x}', indent=12)}
+{add_epilogue('offset - 3', 'offset - 2', 'offset - 1', indent=12)}
 
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Main body
 
-    for row_start_offs in range_loc({get_offs(1, 1) + 3:#x}, {get_offs(1, h - 1) + 3:#x}, {down:#x}):
-        for offset in range_loc(row_start_offs, row_start_offs + {stride - 8:#x}, {right:#x}):
-            if not data[offset]:  # (fully transparent pixel)
-                neighbors = []
-
-{add_relative_neighbor('(x, y - 1)', up, indent=16)}
-
-{add_relative_neighbor('(x + 1, y - 1)', right, indent=16)}
-
-{add_relative_neighbor('(x + 1, y)', down, indent=16)}
-
-{add_relative_neighbor('(x + 1, y + 1)', down, indent=16)}
-
-{add_relative_neighbor('(x, y + 1)', left, indent=16)}
-
-{add_relative_neighbor('(x - 1, y + 1)', left, indent=16)}
-
-{add_relative_neighbor('(x - 1, y)', up, indent=16)}
-
-{add_relative_neighbor('(x - 1, y - 1)', up, indent=16)}
-
-{add_epilogue('offset', 'offset + 1', 'offset + 2', f'offset += {stride + 1:#x}', indent=16)}
+{main_body}
 '''.strip('\n')
 
 
@@ -402,10 +613,9 @@ def main():
 
                 if (x2, y2) in expected:
                     expected.remove((x2, y2))
-                    query_2, yield_next = (yield yield_next), b'\0\0\0'
-
-                    expected_2 = slice(query - 3, query, None)
-                    assert query_2 == expected_2, f'function accessed the wrong RGB bytes for ({x2}, {y2}): expected {expected_2}, got {query_2}'
+                    for expected_2 in range(query - 3, query):
+                        query_2, yield_next = (yield yield_next), 0
+                        assert query_2 == expected_2, f'function accessed the wrong RGB bytes for ({x2}, {y2}): expected {expected_2:#x}, got {query_2}'
                 else:
                     raise RuntimeError(f'function accessed a wrong neighbor pixel ({x2}, {y2}) for ({x}, {y})')
 
@@ -417,10 +627,62 @@ def main():
     WeirdFakeBytearray((lambda at: color_transparent_pixels_around_edges(at, w, h)), weird_iterator_thing(), w * h * 4).run()
     print('Success!')
 
+    # The optimized implementation skips over rows without any fully
+    # transparent pixels by checking slices of the data, which the
+    # access-pattern test above can't follow. So compare its results
+    # against the main implementation's instead, using a few different
+    # amounts of transparency
     print('Running correctness test for optimized implementation...')
-    WeirdFakeBytearray(locals()['color_transparent_pixels_around_edges_24_24'], weird_iterator_thing(), w * h * 4).run()
+    for seed in range(4):
+        test_data_2 = bytearray(make_test_data(w, h, seed=seed))
+        for offs in range(3, w * h * 4, 4 << seed):
+            test_data_2[offs] = 255
+        expected = bytearray(test_data_2)
+        color_transparent_pixels_around_edges(expected, w, h)
+        actual = bytearray(test_data_2)
+        locals()['color_transparent_pixels_around_edges_24_24'](actual)
+        if actual != expected:
+            raise RuntimeError('optimized implementation gave different results')
     print('Success!')
 
+    if np is not None:
+        print('Running speed test for NumPy implementation...')
+        print(timeit.timeit(
+            f'fxn(ba, {w}, {h})',
+            setup='ba = bytearray(test_data)',
+            globals={'fxn': color_transparent_pixels_around_edges_numpy, 'test_data': test_data},
+            number=10) / 10)
+
+        print('Running correctness test for NumPy implementation...')
+        expected = bytearray(test_data)
+        color_transparent_pixels_around_edges(expected, w, h)
+        actual = bytearray(test_data)
+        color_transparent_pixels_around_edges_numpy(actual, w, h)
+        if actual != expected:
+            raise RuntimeError('NumPy implementation gave different results')
+        print('Success!')
+    else:
+        print('Skipping tests for NumPy implementation (NumPy not installed)')
+
+    if numba is not None:
+        print('Running speed test for Numba implementation...')
+        print(timeit.timeit(
+            f'fxn(ba, {w}, {h})',
+            setup='ba = bytearray(test_data)',
+            globals={'fxn': color_transparent_pixels_around_edges_numba, 'test_data': test_data},
+            number=10) / 10)
+
+        print('Running correctness test for Numba implementation...')
+        expected = bytearray(test_data)
+        color_transparent_pixels_around_edges(expected, w, h)
+        actual = bytearray(test_data)
+        color_transparent_pixels_around_edges_numba(actual, w, h)
+        if actual != expected:
+            raise RuntimeError('Numba implementation gave different results')
+        print('Success!')
+    else:
+        print('Skipping tests for Numba implementation (Numba not installed)')
+
 
 if __name__ == '__main__':
     main()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
-from ctypes import create_string_buffer
+import array
+from collections import namedtuple
 import os, os.path
 import struct
 import sys
@@ -15,14 +16,14 @@ except ImportError:
     except ImportError:
         raise RuntimeError('Could not find any supported Qt bindings. Please read the readme for more information.')
 
+VersionTuple = namedtuple('VersionTuple', 'major minor patch')
+
 def pyqtVersionToTuple(v):
-    return (v >> 16, (v >> 8) & 0xff, v & 0xff)
+    return VersionTuple(v >> 16, (v >> 8) & 0xff, v & 0xff)
 
 Qt = QtCore.Qt
-QtCompatVersion = tuple([int(c) for c in QtCore.qVersion().split('.')])
-QtBindingsVersion = (QtCore.PYQT_VERSION >> 16,
-                     (QtCore.PYQT_VERSION >> 8) & 0xff,
-                     QtCore.PYQT_VERSION & 0xff)
+QtCompatVersion = VersionTuple(*map(int, QtCore.qVersion().split('.')[:3]))
+QtBindingsVersion = pyqtVersionToTuple(QtCore.PYQT_VERSION)
 
 import archive
 import lz77
@@ -33,6 +34,20 @@ try:
 except ImportError:
     HaveNSMBLib = False
 
+# Whether nsmblib's compression works (see PackTexture()). Only checked
+# the first time it's needed.
+NSMBLibCompressionWorking = None
+
+
+def decompressLZ(data):
+    """
+    Decompresses LZ77 (LZS11) data, using nsmblib's native decoder
+    when it's available
+    """
+    if HaveNSMBLib:
+        return nsmblib.decompress11LZS(data)
+    return lz77.LZS11().Decompress11LZS(data)
+
 
 ########################################################
 # To Do:
@@ -77,39 +92,77 @@ def module_path():
     return None
 
 
+IconCache = {}
+
+def getIcon(filename):
+    """
+    Returns a QIcon for the given image file. Each file is only loaded
+    once; later calls return the same QIcon.
+    """
+    icon = IconCache.get(filename)
+    if icon is None:
+        icon = IconCache[filename] = QtGui.QIcon(filename)
+    return icon
+
+
+def getPixmap(filename):
+    """
+    Returns a QPixmap for the given image file. Decoded images are kept in
+    Qt's QPixmapCache, so a file is only read again if Qt evicts it.
+    """
+    pix = QtGui.QPixmapCache.find(filename)
+    if pix is None or pix.isNull():
+        pix = QtGui.QPixmap(filename)
+        QtGui.QPixmapCache.insert(filename, pix)
+    return pix
+
+
+# Colors and style sheet used by setUpDarkMode().
+# Taken from https://gist.github.com/QuantumCD/6245215
+DarkModeColors = (
+    (QtGui.QPalette.ColorRole.Window, QtGui.QColor(53,53,53)),
+    (QtGui.QPalette.ColorRole.WindowText, QtCore.Qt.GlobalColor.white),
+    (QtGui.QPalette.ColorRole.Base, QtGui.QColor(25,25,25)),
+    (QtGui.QPalette.ColorRole.AlternateBase, QtGui.QColor(53,53,53)),
+    (QtGui.QPalette.ColorRole.ToolTipBase, QtCore.Qt.GlobalColor.white),
+    (QtGui.QPalette.ColorRole.ToolTipText, QtCore.Qt.GlobalColor.white),
+    (QtGui.QPalette.ColorRole.Text, QtCore.Qt.GlobalColor.white),
+    (QtGui.QPalette.ColorRole.Button, QtGui.QColor(53,53,53)),
+    (QtGui.QPalette.ColorRole.ButtonText, QtCore.Qt.GlobalColor.white),
+    (QtGui.QPalette.ColorRole.BrightText, QtCore.Qt.GlobalColor.red),
+    (QtGui.QPalette.ColorRole.Link, QtGui.QColor(42, 130, 218)),
+
+    (QtGui.QPalette.ColorRole.Highlight, QtGui.QColor(42, 130, 218)),
+    (QtGui.QPalette.ColorRole.HighlightedText, QtCore.Qt.GlobalColor.black),
+)
+
+# fix for disabled menu options
+DarkModeDisabledColors = (
+    (QtGui.QPalette.ColorRole.Text, QtGui.QColor(127,127,127)),
+    (QtGui.QPalette.ColorRole.Light, QtGui.QColor(53,53,53)),
+)
+
+DarkModeStyleSheet = """
+    QToolTip { color: #ffffff; background-color: #2a82da; border: 1px solid white }
+    #qt_toolbar_ext_button { background-color: #555; border: 1px solid #888; border-radius: 2px }
+    #qt_toolbar_ext_button::hover { background-color: #666 }
+"""
+
+
 def setUpDarkMode():
     """Sets up dark mode theming"""
-    # Taken from https://gist.github.com/QuantumCD/6245215
 
     app.setStyle(QtWidgets.QStyleFactory.create('Fusion'))
 
     darkPalette = QtGui.QPalette()
-    darkPalette.setColor(QtGui.QPalette.ColorRole.Window, QtGui.QColor(53,53,53))
-    darkPalette.setColor(QtGui.QPalette.ColorRole.WindowText, QtCore.Qt.GlobalColor.white)
-    darkPalette.setColor(QtGui.QPalette.ColorRole.Base, QtGui.QColor(25,25,25))
-    darkPalette.setColor(QtGui.QPalette.ColorRole.AlternateBase, QtGui.QColor(53,53,53))
-    darkPalette.setColor(QtGui.QPalette.ColorRole.ToolTipBase, QtCore.Qt.GlobalColor.white)
-    darkPalette.setColor(QtGui.QPalette.ColorRole.ToolTipText, QtCore.Qt.GlobalColor.white)
-    darkPalette.setColor(QtGui.QPalette.ColorRole.Text, QtCore.Qt.GlobalColor.white)
-    darkPalette.setColor(QtGui.QPalette.ColorRole.Button, QtGui.QColor(53,53,53))
-    darkPalette.setColor(QtGui.QPalette.ColorRole.ButtonText, QtCore.Qt.GlobalColor.white)
-    darkPalette.setColor(QtGui.QPalette.ColorRole.BrightText, QtCore.Qt.GlobalColor.red)
-    darkPalette.setColor(QtGui.QPalette.ColorRole.Link, QtGui.QColor(42, 130, 218))
-
-    darkPalette.setColor(QtGui.QPalette.ColorRole.Highlight, QtGui.QColor(42, 130, 218))
-    darkPalette.setColor(QtGui.QPalette.ColorRole.HighlightedText, QtCore.Qt.GlobalColor.black)
-
-    # fix for disabled menu options
-    darkPalette.setColor(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Text, QtGui.QColor(127,127,127))
-    darkPalette.setColor(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Light, QtGui.QColor(53,53,53))
+    for role, color in DarkModeColors:
+        darkPalette.setColor(role, color)
+    for role, color in DarkModeDisabledColors:
+        darkPalette.setColor(QtGui.QPalette.ColorGroup.Disabled, role, color)
 
     app.setPalette(darkPalette)
 
-    app.setStyleSheet("""
-        QToolTip { color: #ffffff; background-color: #2a82da; border: 1px solid white }
-        #qt_toolbar_ext_button { background-color: #555; border: 1px solid #888; border-radius: 2px }
-        #qt_toolbar_ext_button::hover { background-color: #666 }
-    """)
+    app.setStyleSheet(DarkModeStyleSheet)
 
 
 #############################################################################################
@@ -117,25 +170,45 @@ def setUpDarkMode():
 
 class TilesetClass():
     '''Contains Tileset data. Inits itself to a blank tileset.
-    Methods: addTile, removeTile, addObject, removeObject, clear'''
+    Methods: addTile, addTiles, removeTile, addObject, removeObject, clear'''
 
     class Tile():
+        __slots__ = ('image', 'noalpha', 'data')
+
         def __init__(self, image, noalpha, bytelist):
             '''Tile Constructor'''
 
             self.image = image
             self.noalpha = noalpha
-            self.byte0 = bytelist[0]
-            self.byte1 = bytelist[1]
-            self.byte2 = bytelist[2]
-            self.byte3 = bytelist[3]
-            self.byte4 = bytelist[4]
-            self.byte5 = bytelist[5]
-            self.byte6 = bytelist[6]
-            self.byte7 = bytelist[7]
+
+            # The tile's 8 behaviour bytes, exactly as they're stored in
+            # the tileset file
+            self.data = bytearray(bytelist)
+
+        def _byteProperty(n):
+            '''Makes a property for reading and writing one behaviour byte'''
+
+            def getter(self):
+                return self.data[n]
+
+            def setter(self, value):
+                self.data[n] = value
+
+            return property(getter, setter)
+
+        byte0 = _byteProperty(0)
+        byte1 = _byteProperty(1)
+        byte2 = _byteProperty(2)
+        byte3 = _byteProperty(3)
+        byte4 = _byteProperty(4)
+        byte5 = _byteProperty(5)
+        byte6 = _byteProperty(6)
+        byte7 = _byteProperty(7)
+        del _byteProperty
 
 
     class Object():
+        __slots__ = ('height', 'width', 'upperslope', 'lowerslope', 'tiles')
 
         def __init__(self, height, width, uslope, lslope, tilelist):
             '''Tile Constructor'''
@@ -154,7 +227,7 @@ class TilesetClass():
 
         self.tiles = []
         self.objects = []
-        self.unknownFiles = {}
+        self.unknownFiles = []
 
         self.slot = 0
 
@@ -165,6 +238,16 @@ class TilesetClass():
         self.tiles.append(self.Tile(image, noalpha, bytelist))
 
 
+    def addTiles(self, images, noalphas, behaviourdata):
+        '''Adds a tile for each pair of images, reading the tiles' behaviours
+        from consecutive 8-byte entries in behaviourdata'''
+
+        Tile = self.Tile
+        data = memoryview(behaviourdata)
+        self.tiles.extend(Tile(image, noalpha, data[i * 8 : i * 8 + 8])
+                          for i, (image, noalpha) in enumerate(zip(images, noalphas)))
+
+
     def addObject(self, height = 1, width = 1,  uslope = [0, 0], lslope = [0, 0], tilelist = [[(0, 0, 0)]]):
         '''Adds a new object'''
 
@@ -187,13 +270,255 @@ class TilesetClass():
 
         self.tiles = []
         self.objects = []
-        self.unknownFiles = {}
+        self.unknownFiles = []
+
+        self.slot = 0
 
 
 #############################################################################################
 ######################### Palette for painting behaviours to tiles ##########################
 
 
+# Rows of (name, icon filename[, tooltip]). These never change, so they
+# are shared by every palette; icons are only loaded through getIcon().
+CoreTypes = (('Default', 'Icons/Core/Default.png', 'The standard type for tiles.\n\nAny regular terrain or backgrounds\nshould be of generic type. It has no\n collision properties.'),
+             ('Slope', 'Icons/Core/Slope.png', 'Defines a sloped tile\n\nSloped tiles have sloped collisions,\nwhich Mario can slide on.\n\nNote: Do NOT set slopes to have solid collision.'),
+             ('Reverse Slope', 'Icons/Core/RSlope.png', 'Defines an upside-down slope.\n\nSloped tiles have sloped collisions,\nwhich Mario can slide on.\n\nNote: Do NOT set slopes to have solid collision.'),
+             ('Partial Block', 'Icons/Partial/Full.png', 'Used for blocks with partial collisions.\n\nVery useful for Mini-Mario secret\nareas, but also for providing a more\naccurate collision map for your tiles.'),
+             ('Coin', 'Icons/Core/Coin.png', 'Creates a coin.\n\nCoins have no solid collision,\nand when touched will disappear\nand increment the coin counter.'),
+             ('Explodable Block', 'Icons/Core/Explode.png', 'Specifies blocks which can explode.\n\nThese blocks will shatter into componenent\npieces when hit by a bom-omb or meteor.\nThe pieces themselves may be hardcoded\nand must be included in the tileset.\nBehaviour may be sporadic.'),
+             ('Climable Grid', 'Icons/Core/Climb.png', 'Creates terrain that can be climbed on.\n\nClimable terrain cannot be walked on.\nWhen Mario is overtop of a climable\ntile and the player presses up,\nMario will enter a climbing state.'),
+             ('Spike', 'Icons/Core/Spike.png', 'Dangerous Spikey spikes.\n\nSpike tiles will damage Mario one hit\nwhen they are touched.'),
+             ('Pipe', 'Icons/Core/Pipe.png', "Denotes a pipe tile.\n\nPipe tiles are specified according to\nthe part of the pipe. It's important\nto specify the right parts or\nentrances will not function correctly."),
+             ('Rails', 'Icons/Core/Rails.png', 'Used for all types of rails.\n\nPlease note that Pa3_rail.arc is hardcoded\nto replace rails with 3D models.'),
+             ('Conveyor Belt', 'Icons/Core/Conveyor.png', 'Defines moving tiles.\n\nMoving tiles will move Mario in one\ndirection or another. Parameters are\nlargely unknown at this time.'),
+             ('Question Block', 'Icons/Core/Qblock.png', 'Creates question blocks.'))
+
+PropertyTypes = (('Solid', 'Icons/Prop/Solid.png', 'Tiles you can walk on.\n\nThe tiles we be a solid basic square\nthrough which Mario can not pass.'),
+                 ('Block', 'Icons/Prop/Break.png', 'This denotes breakable tiles such\nas brick blocks. It is likely that these\nare subject to the same issues as\nexplodable blocks. They emit a coin\nwhen hit.'),
+                 ('Falling Block', 'Icons/Prop/Fall.png', 'Sets the block to fall after a set period. The\nblock is sadly replaced with a donut lift model.'),
+                 ('Ledge', 'Icons/Prop/Ledge.png', 'A ledge tile with unique properties.\n\nLedges can be shimmied along or\nhung from, but not walked along\nas with normal terrain. Must have the\nledge terrain type set as well.'),
+                 ('Meltable', 'Icons/Prop/Melt.png', 'Supposedly allows melting the tile?'))
+
+TerrainTypes = (('Default', 'Icons/Core/Default.png'),
+                ('Ice', 'Icons/Terrain/Ice.png'),
+                ('Snow', 'Icons/Terrain/Snow.png'),
+                ('Quicksand', 'Icons/Terrain/Quicksand.png'),
+                ('Conveyor Belt Right', 'Icons/Core/Conveyor.png'),
+                ('Conveyor Belt Left', 'Icons/Core/Conveyor.png'),
+                ('Horiz. Climbing Rope', 'Icons/Terrain/Rope.png'),
+                ('Anti Wall Jumps', 'Icons/Terrain/Spike.png'),
+                ('Ledge', 'Icons/Terrain/Ledge.png'),
+                ('Ladder', 'Icons/Terrain/Ladder.png'),
+                ('Staircase', 'Icons/Terrain/Stairs.png'),
+                ('Carpet', 'Icons/Terrain/Carpet.png'),
+                ('Dusty', 'Icons/Terrain/Dust.png'),
+                ('Grass', 'Icons/Terrain/Grass.png'),
+                ('Muffled', 'Icons/Unknown.png'),
+                ('Beach Sand', 'Icons/Terrain/Sand.png'))
+
+GenericParams = (('None', 'Icons/Core/Default.png'),
+                 ('Beanstalk Stop', 'Icons//Generic/Beanstopper.png'),
+                 ('Dash Coin', 'Icons/Generic/Outline.png'),
+                 ('Battle Coin', 'Icons/Generic/Outline.png'),
+                 ('Red Block Outline A', 'Icons/Generic/RedBlock.png'),
+                 ('Red Block Outline B', 'Icons/Generic/RedBlock.png'),
+                 ('Cave Entrance Right', 'Icons/Generic/Cave-Right.png'),
+                 ('Cave Entrance Left', 'Icons/Generic/Cave-Left.png'),
+                 ('Unknown', 'Icons/Unknown.png'),
+                 ('Layer 0 Pit', 'Icons/Unknown.png'))
+
+# byte7 values for the first three generic parameters; later ones are index + 0x32
+GenericParamBytes = (0, 0x23, 0x28)
+
+RailParams = (('None', 'Icons/Core/Default.png'),
+              ('Rail: Upslope', 'Icons/'),
+              ('Rail: Downslope', 'Icons/'),
+              ('Rail: 90 degree Corner Fill', 'Icons/'),
+              ('Rail: 90 degree Corner', 'Icons/'),
+              ('Rail: Horizontal Rail', 'Icons/'),
+              ('Rail: Vertical Rail', 'Icons/'),
+              ('Rail: Unknown', 'Icons/Unknown.png'),
+              ('Rail: Gentle Upslope 2', 'Icons/'),
+              ('Rail: Gentle Upslope 1', 'Icons/'),
+              ('Rail: Gentle Downslope 2', 'Icons/'),
+              ('Rail: Gentle Downslope 1', 'Icons/'),
+              ('Rail: Steep Upslope 2', 'Icons/'),
+              ('Rail: Steep Upslope 1', 'Icons/'),
+              ('Rail: Steep Downslope 2', 'Icons/'),
+              ('Rail: Steep Downslope 1', 'Icons/'),
+              ('Rail: One Panel Circle', 'Icons/'),
+              ('Rail: 2x2 Circle Upper Right', 'Icons/'),
+              ('Rail: 2x2 Circle Upper Left', 'Icons/'),
+              ('Rail: 2x2 Circle Lower Right', 'Icons/'),
+              ('Rail: 2x2 Circle Lower Left', 'Icons/'),
+              ('Rail: 4x4 Circle Top Left Corner', 'Icons/'),
+              ('Rail: 4x4 Circle Top Left', 'Icons/'),
+              ('Rail: 4x4 Circle Top Right', 'Icons/'),
+              ('Rail: 4x4 Circle Top Right Corner', 'Icons/'),
+              ('Rail: 4x4 Circle Upper Left Side', 'Icons/'),
+              ('Rail: 4x4 Circle Upper Right Side', 'Icons/'),
+              ('Rail: 4x4 Circle Lower Left Side', 'Icons/'),
+              ('Rail: 4x4 Circle Lower Right Side', 'Icons/'),
+              ('Rail: 4x4 Circle Bottom Left Corner', 'Icons/'),
+              ('Rail: 4x4 Circle Bottom Left', 'Icons/'),
+              ('Rail: 4x4 Circle Bottom Right', 'Icons/'),
+              ('Rail: 4x4 Circle Bottom Right Corner', 'Icons/'),
+              ('Rail: Unknown', 'Icons/Unknown.png'),
+              ('Rail: End Stop', 'Icons/'))
+
+ClimableGridParams = (('None', 'Icons/Core/Default.png'),
+                      ('Free Move', 'Icons/Climb/Center.png'),
+                      ('Upper Left Corner', 'Icons/Climb/UpperLeft.png'),
+                      ('Top', 'Icons/Climb/Top.png'),
+                      ('Upper Right Corner', 'Icons/Climb/UpperRight.png'),
+                      ('Left Side', 'Icons/Climb/Left.png'),
+                      ('Center', 'Icons/Climb/Center.png'),
+                      ('Right Side', 'Icons/Climb/Right.png'),
+                      ('Lower Left Corner', 'Icons/Climb/LowerLeft.png'),
+                      ('Bottom', 'Icons/Climb/Bottom.png'),
+                      ('Lower Right Corner', 'Icons/Climb/LowerRight.png'))
+
+CoinParams = (('Generic Coin', 'Icons/QBlock/Coin.png'),
+              ('Coin', 'Icons/Unknown.png'),
+              ('Nothing', 'Icons/Unknown.png'),
+              ('Coin', 'Icons/Unknown.png'),
+              ('Pow Block Coin', 'Icons/Coin/POW.png'))
+
+ExplodableBlockParams = (('None', 'Icons/Core/Default.png'),
+                         ('Stone Block', 'Icons/Explode/Stone.png'),
+                         ('Wooden Block', 'Icons/Explode/Wooden.png'),
+                         ('Red Block', 'Icons/Explode/Red.png'),
+                         ('Unknown', 'Icons/Unknown.png'),
+                         ('Unknown', 'Icons/Unknown.png'),
+                         ('Unknown', 'Icons/Unknown.png'))
+
+PipeParams = (('Vert. Top Entrance Left', 'Icons/Pipes/'),
+              ('Vert. Top Entrance Right', 'Icons/'),
+              ('Vert. Bottom Entrance Left', 'Icons/'),
+              ('Vert. Bottom Entrance Right', 'Icons/'),
+              ('Vert. Center Left', 'Icons/'),
+              ('Vert. Center Right', 'Icons/'),
+              ('Vert. On Top Junction Left', 'Icons/'),
+              ('Vert. On Top Junction Right', 'Icons/'),
+              ('Horiz. Left Entrance Top', 'Icons/'),
+              ('Horiz. Left Entrance Bottom', 'Icons/'),
+              ('Horiz. Right Entrance Top', 'Icons/'),
+              ('Horiz. Right Entrance Bottom', 'Icons/'),
+              ('Horiz. Center Top', 'Icons/'),
+              ('Horiz. Center Bottom', 'Icons/'),
+              ('Horiz. On Top Junction Top', 'Icons/'),
+              ('Horiz. On Top Junction Bottom', 'Icons/'),
+              ('Vert. Mini Pipe Top', 'Icons/'),
+              ('Unknown', 'Icons/Unknown.png'),
+              ('Vert. Mini Pipe Bottom', 'Icons/'),
+              ('Unknown', 'Icons/Unknown.png'),
+              ('Unknown', 'Icons/Unknown.png'),
+              ('Unknown', 'Icons/Unknown.png'),
+              ('Vert. On Top Mini-Junction', 'Icons/'),
+              ('Unknown', 'Icons/Unknown.png'),
+              ('Horiz. Mini Pipe Left', 'Icons/'),
+              ('Unknown', 'Icons/Unknown.png'),
+              ('Horiz. Mini Pipe Right', 'Icons/'),
+              ('Unknown', 'Icons/Unknown.png'),
+              ('Vert. Mini Pipe Center', 'Icons/'),
+              ('Horiz. Mini Pipe Center', 'Icons/'),
+              ('Horiz. On Top Mini-Junction', 'Icons/'),
+              ('Block Covered Corner', 'Icons/'))
+
+PartialBlockParams = (('None', 'Icons/Core/Default.png'),
+                      ('Upper Left', 'Icons/Partial/UpLeft.png'),
+                      ('Upper Right', 'Icons/Partial/UpRight.png'),
+                      ('Top Half', 'Icons/Partial/TopHalf.png'),
+                      ('Lower Left', 'Icons/Partial/LowLeft.png'),
+                      ('Left Half', 'Icons/Partial/LeftHalf.png'),
+                      ('Diagonal Downwards', 'Icons/Partial/DiagDn.png'),
+                      ('Upper Left 3/4', 'Icons/Partial/UpLeft3-4.png'),
+                      ('Lower Right', 'Icons/Partial/LowRight.png'),
+                      ('Diagonal Downwards', 'Icons/Partial/DiagDn.png'),
+                      ('Right Half', 'Icons/Partial/RightHalf.png'),
+                      ('Upper Right 3/4', 'Icons/Partial/UpRig3-4.png'),
+                      ('Lower Half', 'Icons/Partial/LowHalf.png'),
+                      ('Lower Left 3/4', 'Icons/Partial/LowLeft3-4.png'),
+                      ('Lower Right 3/4', 'Icons/Partial/LowRight3-4.png'),
+                      ('Full Brick', 'Icons/Partial/Full.png'))
+
+SlopeParams = (('Steep Upslope', 'Icons/Slope/steepslopeleft.png'),
+               ('Steep Downslope', 'Icons/Slope/steepsloperight.png'),
+               ('Upslope 1', 'Icons/Slope/slopeleft.png'),
+               ('Upslope 2', 'Icons/Slope/slope3left.png'),
+               ('Downslope 1', 'Icons/Slope/slope3right.png'),
+               ('Downslope 2', 'Icons/Slope/sloperight.png'),
+               ('Steep Upslope 1', 'Icons/Slope/vsteepup1.png'),
+               ('Steep Upslope 2', 'Icons/Slope/vsteepup2.png'),
+               ('Steep Downslope 1', 'Icons/Slope/vsteepdown1.png'),
+               ('Steep Downslope 2', 'Icons/Slope/vsteepdown2.png'),
+               ('Slope Edge (solid)', 'Icons/Slope/edge.png'),
+               ('Gentle Upslope 1', 'Icons/Slope/gentleupslope1.png'),
+               ('Gentle Upslope 2', 'Icons/Slope/gentleupslope2.png'),
+               ('Gentle Upslope 3', 'Icons/Slope/gentleupslope3.png'),
+               ('Gentle Upslope 4', 'Icons/Slope/gentleupslope4.png'),
+               ('Gentle Downslope 1', 'Icons/Slope/gentledownslope1.png'),
+               ('Gentle Downslope 2', 'Icons/Slope/gentledownslope2.png'),
+               ('Gentle Downslope 3', 'Icons/Slope/gentledownslope3.png'),
+               ('Gentle Downslope 4', 'Icons/Slope/gentledownslope4.png'))
+
+ReverseSlopeParams = (('Steep Downslope', 'Icons/Slope/Rsteepslopeleft.png'),
+                      ('Steep Upslope', 'Icons/Slope/Rsteepsloperight.png'),
+                      ('Downslope 1', 'Icons/Slope/Rslopeleft.png'),
+                      ('Downslope 2', 'Icons/Slope/Rslope3left.png'),
+                      ('Upslope 1', 'Icons/Slope/Rslope3right.png'),
+                      ('Upslope 2', 'Icons/Slope/Rsloperight.png'),
+                      ('Steep Downslope 1', 'Icons/Slope/Rvsteepdown1.png'),
+                      ('Steep Downslope 2', 'Icons/Slope/Rvsteepdown2.png'),
+                      ('Steep Upslope 1', 'Icons/Slope/Rvsteepup1.png'),
+                      ('Steep Upslope 2', 'Icons/Slope/Rvsteepup2.png'),
+                      ('Slope Edge (solid)', 'Icons/Slope/edge.png'),
+                      ('Gentle Downslope 1', 'Icons/Slope/Rgentledownslope1.png'),
+                      ('Gentle Downslope 2', 'Icons/Slope/Rgentledownslope2.png'),
+                      ('Gentle Downslope 3', 'Icons/Slope/Rgentledownslope3.png'),
+                      ('Gentle Downslope 4', 'Icons/Slope/Rgentledownslope4.png'),
+                      ('Gentle Upslope 1', 'Icons/Slope/Rgentleupslope1.png'),
+                      ('Gentle Upslope 2', 'Icons/Slope/Rgentleupslope2.png'),
+                      ('Gentle Upslope 3', 'Icons/Slope/Rgentleupslope3.png'),
+                      ('Gentle Upslope 4', 'Icons/Slope/Rgentleupslope4.png'))
+
+SpikeParams = (('Double Left Spikes', 'Icons/Spike/Left.png'),
+               ('Double Right Spikes', 'Icons/Spike/Right.png'),
+               ('Double Upwards Spikes', 'Icons/Spike/Up.png'),
+               ('Double Downwards Spikes', 'Icons/Spike/Down.png'),
+               ('Long Spike Down 1', 'Icons/Spike/LongDown1.png'),
+               ('Long Spike Down 2', 'Icons/Spike/LongDown2.png'),
+               ('Single Downwards Spike', 'Icons/Spike/SingDown.png'),
+               ('Spike Block', 'Icons/Unknown.png'))
+
+ConveyorBeltParams = (('Slow', 'Icons/Unknown.png'),
+                      ('Fast', 'Icons/Unknown.png'))
+
+QBlockParams = (('Fire Flower', 'Icons/Qblock/Fire.png'),
+                ('Star', 'Icons/Qblock/Star.png'),
+                ('Coin', 'Icons/Qblock/Coin.png'),
+                ('Vine', 'Icons/Qblock/Vine.png'),
+                ('1-Up', 'Icons/Qblock/1up.png'),
+                ('Mini Mushroom', 'Icons/Qblock/Mini.png'),
+                ('Propeller Suit', 'Icons/Qblock/Prop.png'),
+                ('Penguin Suit', 'Icons/Qblock/Peng.png'),
+                ('Ice Flower', 'Icons/Qblock/IceF.png'))
+
+ParameterTypes = (GenericParams,
+                  SlopeParams,
+                  ReverseSlopeParams,
+                  PartialBlockParams,
+                  CoinParams,
+                  ExplodableBlockParams,
+                  ClimableGridParams,
+                  SpikeParams,
+                  PipeParams,
+                  RailParams,
+                  ConveyorBeltParams,
+                  QBlockParams)
+
+
 class paletteWidget(QtWidgets.QWidget):
 
     def __init__(self, window):
@@ -204,59 +529,27 @@ class paletteWidget(QtWidgets.QWidget):
         self.coreType = QtWidgets.QGroupBox()
         self.coreType.setTitle('Core Type:')
         self.coreWidgets = []
-        coreLayout = QtWidgets.QVBoxLayout()
-        rowA = QtWidgets.QHBoxLayout()
-        rowB = QtWidgets.QHBoxLayout()
-        rowC = QtWidgets.QHBoxLayout()
-        rowD = QtWidgets.QHBoxLayout()
-        rowE = QtWidgets.QHBoxLayout()
-        rowF = QtWidgets.QHBoxLayout()
-
-        path = 'Icons/'
-
-        self.coreTypes = [['Default', QtGui.QIcon(path + 'Core/Default.png'), 'The standard type for tiles.\n\nAny regular terrain or backgrounds\nshould be of generic type. It has no\n collision properties.'],
-                     ['Slope', QtGui.QIcon(path + 'Core/Slope.png'), 'Defines a sloped tile\n\nSloped tiles have sloped collisions,\nwhich Mario can slide on.\n\nNote: Do NOT set slopes to have solid collision.'],
-                     ['Reverse Slope', QtGui.QIcon(path + 'Core/RSlope.png'), 'Defines an upside-down slope.\n\nSloped tiles have sloped collisions,\nwhich Mario can slide on.\n\nNote: Do NOT set slopes to have solid collision.'],
-                     ['Partial Block', QtGui.QIcon(path + 'Partial/Full.png'), 'Used for blocks with partial collisions.\n\nVery useful for Mini-Mario secret\nareas, but also for providing a more\naccurate collision map for your tiles.'],
-                     ['Coin', QtGui.QIcon(path + 'Core/Coin.png'), 'Creates a coin.\n\nCoins have no solid collision,\nand when touched will disappear\nand increment the coin counter.'],
-                     ['Explodable Block', QtGui.QIcon(path + 'Core/Explode.png'), 'Specifies blocks which can explode.\n\nThese blocks will shatter into componenent\npieces when hit by a bom-omb or meteor.\nThe pieces themselves may be hardcoded\nand must be included in the tileset.\nBehaviour may be sporadic.'],
-                     ['Climable Grid', QtGui.QIcon(path + 'Core/Climb.png'), 'Creates terrain that can be climbed on.\n\nClimable terrain cannot be walked on.\nWhen Mario is overtop of a climable\ntile and the player presses up,\nMario will enter a climbing state.'],
-                     ['Spike', QtGui.QIcon(path + 'Core/Spike.png'), 'Dangerous Spikey spikes.\n\nSpike tiles will damage Mario one hit\nwhen they are touched.'],
-                     ['Pipe', QtGui.QIcon(path + 'Core/Pipe.png'), "Denotes a pipe tile.\n\nPipe tiles are specified according to\nthe part of the pipe. It's important\nto specify the right parts or\nentrances will not function correctly."],
-                     ['Rails', QtGui.QIcon(path + 'Core/Rails.png'), 'Used for all types of rails.\n\nPlease note that Pa3_rail.arc is hardcoded\nto replace rails with 3D models.'],
-                     ['Conveyor Belt', QtGui.QIcon(path + 'Core/Conveyor.png'), 'Defines moving tiles.\n\nMoving tiles will move Mario in one\ndirection or another. Parameters are\nlargely unknown at this time.'],
-                     ['Question Block', QtGui.QIcon(path + 'Core/Qblock.png'), 'Creates question blocks.']]
-
-        i = 0
-        for item in range(len(self.coreTypes)):
-            self.coreWidgets.append(QtWidgets.QRadioButton())
-            if i == 0:
-                self.coreWidgets[item].setText('Default')
-            else:
-                self.coreWidgets[item].setIcon(self.coreTypes[item][1])
-            self.coreWidgets[item].setIconSize(QtCore.QSize(24, 24))
-            self.coreWidgets[item].setToolTip(self.coreTypes[item][2])
-            self.coreWidgets[item].clicked.connect(self.swapParams)
-            if i < 2:
-                rowA.addWidget(self.coreWidgets[item])
-            elif i < 4:
-                rowB.addWidget(self.coreWidgets[item])
-            elif i < 6:
-                rowC.addWidget(self.coreWidgets[item])
-            elif i < 8:
-                rowD.addWidget(self.coreWidgets[item])
-            elif i < 10:
-                rowE.addWidget(self.coreWidgets[item])
+        coreLayout = QtWidgets.QGridLayout()
+
+        iconSize = QtCore.QSize(24, 24)
+
+        self.coreTypes = CoreTypes
+        self.coreGroup = QtWidgets.QButtonGroup(self)
+        for item, (name, icon, tooltip) in enumerate(self.coreTypes):
+            button = QtWidgets.QRadioButton()
+            if item == 0:
+                button.setText(name)
             else:
-                rowF.addWidget(self.coreWidgets[item])
-            i += 1
-
-        coreLayout.addLayout(rowA)
-        coreLayout.addLayout(rowB)
-        coreLayout.addLayout(rowC)
-        coreLayout.addLayout(rowD)
-        coreLayout.addLayout(rowE)
-        coreLayout.addLayout(rowF)
+                button.setIcon(getIcon(icon))
+            button.setIconSize(iconSize)
+            button.setToolTip(tooltip)
+            button.clicked.connect(self.swapParams)
+            self.coreGroup.addButton(button, item)
+            self.coreWidgets.append(button)
+
+            # Two buttons per row
+            coreLayout.addWidget(button, item // 2, item % 2)
+
         self.coreType.setLayout(coreLayout)
 
 
@@ -265,31 +558,27 @@ class paletteWidget(QtWidgets.QWidget):
         self.propertyGroup.setTitle('Properties:')
         propertyLayout = QtWidgets.QVBoxLayout()
         self.propertyWidgets = []
-        propertyList = [['Solid', QtGui.QIcon(path + 'Prop/Solid.png'), 'Tiles you can walk on.\n\nThe tiles we be a solid basic square\nthrough which Mario can not pass.'],
-                        ['Block', QtGui.QIcon(path + 'Prop/Break.png'), 'This denotes breakable tiles such\nas brick blocks. It is likely that these\nare subject to the same issues as\nexplodable blocks. They emit a coin\nwhen hit.'],
-                        ['Falling Block', QtGui.QIcon(path + 'Prop/Fall.png'), 'Sets the block to fall after a set period. The\nblock is sadly replaced with a donut lift model.'],
-                        ['Ledge', QtGui.QIcon(path + 'Prop/Ledge.png'), 'A ledge tile with unique properties.\n\nLedges can be shimmied along or\nhung from, but not walked along\nas with normal terrain. Must have the\nledge terrain type set as well.'],
-                        ['Meltable', QtGui.QIcon(path + 'Prop/Melt.png'), 'Supposedly allows melting the tile?']]
 
-        for item in range(len(propertyList)):
-            self.propertyWidgets.append(QtWidgets.QCheckBox(propertyList[item][0]))
-            self.propertyWidgets[item].setIcon(propertyList[item][1])
-            self.propertyWidgets[item].setIconSize(QtCore.QSize(24, 24))
-            self.propertyWidgets[item].setToolTip(propertyList[item][2])
-            propertyLayout.addWidget(self.propertyWidgets[item])
+        for name, icon, tooltip in PropertyTypes:
+            checkbox = QtWidgets.QCheckBox(name)
+            checkbox.setIcon(getIcon(icon))
+            checkbox.setIconSize(iconSize)
+            checkbox.setToolTip(tooltip)
+            self.propertyWidgets.append(checkbox)
+            propertyLayout.addWidget(checkbox)
 
 
         self.PassThrough = QtWidgets.QRadioButton('Pass-Through')
         self.PassDown = QtWidgets.QRadioButton('Pass-Down')
         self.PassNone = QtWidgets.QRadioButton('No Passing')
 
-        self.PassThrough.setIcon(QtGui.QIcon(path + 'Prop/Pup.png'))
-        self.PassDown.setIcon(QtGui.QIcon(path + 'Prop/Pdown.png'))
-        self.PassNone.setIcon(QtGui.QIcon(path + 'Prop/Pnone.png'))
+        self.PassThrough.setIcon(getIcon('Icons/Prop/Pup.png'))
+        self.PassDown.setIcon(getIcon('Icons/Prop/Pdown.png'))
+        self.PassNone.setIcon(getIcon('Icons/Prop/Pnone.png'))
 
-        self.PassThrough.setIconSize(QtCore.QSize(24, 24))
-        self.PassDown.setIconSize(QtCore.QSize(24, 24))
-        self.PassNone.setIconSize(QtCore.QSize(24, 24))
+        self.PassThrough.setIconSize(iconSize)
+        self.PassDown.setIconSize(iconSize)
+        self.PassNone.setIconSize(iconSize)
 
         self.PassThrough.setToolTip('Allows Mario to jump through the bottom\nof the tile and land on the top.')
         self.PassDown.setToolTip("Allows Mario to fall through the tile but\nbe able to jump up through it. Doesn't seem to actually do anything, though?")
@@ -307,26 +596,14 @@ class paletteWidget(QtWidgets.QWidget):
         self.terrainType = QtWidgets.QComboBox()
         self.terrainLabel = QtWidgets.QLabel('Terrain Type')
 
-        self.terrainTypes = [['Default', QtGui.QIcon(path + 'Core/Default.png')],
-                        ['Ice', QtGui.QIcon(path + 'Terrain/Ice.png')],
-                        ['Snow', QtGui.QIcon(path + 'Terrain/Snow.png')],
-                        ['Quicksand', QtGui.QIcon(path + 'Terrain/Quicksand.png')],
-                        ['Conveyor Belt Right', QtGui.QIcon(path + 'Core/Conveyor.png')],
-                        ['Conveyor Belt Left', QtGui.QIcon(path + 'Core/Conveyor.png')],
-                        ['Horiz. Climbing Rope', QtGui.QIcon(path + 'Terrain/Rope.png')],
-                        ['Anti Wall Jumps', QtGui.QIcon(path + 'Terrain/Spike.png')],
-                        ['Ledge', QtGui.QIcon(path + 'Terrain/Ledge.png')],
-                        ['Ladder', QtGui.QIcon(path + 'Terrain/Ladder.png')],
-                        ['Staircase', QtGui.QIcon(path + 'Terrain/Stairs.png')],
-                        ['Carpet', QtGui.QIcon(path + 'Terrain/Carpet.png')],
-                        ['Dusty', QtGui.QIcon(path + 'Terrain/Dust.png')],
-                        ['Grass', QtGui.QIcon(path + 'Terrain/Grass.png')],
-                        ['Muffled', QtGui.QIcon(path + 'Unknown.png')],
-                        ['Beach Sand', QtGui.QIcon(path + 'Terrain/Sand.png')]]
-
-        for item in range(len(self.terrainTypes)):
-            self.terrainType.addItem(self.terrainTypes[item][1], self.terrainTypes[item][0])
-            self.terrainType.setIconSize(QtCore.QSize(24, 24))
+        self.terrainTypes = TerrainTypes
+        # Fill a model up front and hand it over in one go, rather than
+        # inserting into the combobox's own model one row at a time
+        terrainModel = QtGui.QStandardItemModel(self.terrainType)
+        for name, icon in self.terrainTypes:
+            terrainModel.appendRow(QtGui.QStandardItem(getIcon(icon), name))
+        self.terrainType.setModel(terrainModel)
+        self.terrainType.setIconSize(iconSize)
         self.terrainType.setToolTip('Set the various types of terrain.'
                                     '<ul>'
                                     '<li><b>Default:</b><br>'
@@ -371,206 +648,8 @@ class paletteWidget(QtWidgets.QWidget):
         self.parameterLabel = QtWidgets.QLabel('Parameters')
         self.parameters.addItem('None')
 
-
-        GenericParams = [['None', QtGui.QIcon(path + 'Core/Default.png')],
-                         ['Beanstalk Stop', QtGui.QIcon(path + '/Generic/Beanstopper.png')],
-                         ['Dash Coin', QtGui.QIcon(path + 'Generic/Outline.png')],
-                         ['Battle Coin', QtGui.QIcon(path + 'Generic/Outline.png')],
-                         ['Red Block Outline A', QtGui.QIcon(path + 'Generic/RedBlock.png')],
-                         ['Red Block Outline B', QtGui.QIcon(path + 'Generic/RedBlock.png')],
-                         ['Cave Entrance Right', QtGui.QIcon(path + 'Generic/Cave-Right.png')],
-                         ['Cave Entrance Left', QtGui.QIcon(path + 'Generic/Cave-Left.png')],
-                         ['Unknown', QtGui.QIcon(path + 'Unknown.png')],
-                         ['Layer 0 Pit', QtGui.QIcon(path + 'Unknown.png')]]
-
-        RailParams = [['None', QtGui.QIcon(path + 'Core/Default.png')],
-                      ['Rail: Upslope', QtGui.QIcon(path + '')],
-                      ['Rail: Downslope', QtGui.QIcon(path + '')],
-                      ['Rail: 90 degree Corner Fill', QtGui.QIcon(path + '')],
-                      ['Rail: 90 degree Corner', QtGui.QIcon(path + '')],
-                      ['Rail: Horizontal Rail', QtGui.QIcon(path + '')],
-                      ['Rail: Vertical Rail', QtGui.QIcon(path + '')],
-                      ['Rail: Unknown', QtGui.QIcon(path + 'Unknown.png')],
-                      ['Rail: Gentle Upslope 2', QtGui.QIcon(path + '')],
-                      ['Rail: Gentle Upslope 1', QtGui.QIcon(path + '')],
-                      ['Rail: Gentle Downslope 2', QtGui.QIcon(path + '')],
-                      ['Rail: Gentle Downslope 1', QtGui.QIcon(path + '')],
-                      ['Rail: Steep Upslope 2', QtGui.QIcon(path + '')],
-                      ['Rail: Steep Upslope 1', QtGui.QIcon(path + '')],
-                      ['Rail: Steep Downslope 2', QtGui.QIcon(path + '')],
-                      ['Rail: Steep Downslope 1', QtGui.QIcon(path + '')],
-                      ['Rail: One Panel Circle', QtGui.QIcon(path + '')],
-                      ['Rail: 2x2 Circle Upper Right', QtGui.QIcon(path + '')],
-                      ['Rail: 2x2 Circle Upper Left', QtGui.QIcon(path + '')],
-                      ['Rail: 2x2 Circle Lower Right', QtGui.QIcon(path + '')],
-                      ['Rail: 2x2 Circle Lower Left', QtGui.QIcon(path + '')],
-                      ['Rail: 4x4 Circle Top Left Corner', QtGui.QIcon(path + '')],
-                      ['Rail: 4x4 Circle Top Left', QtGui.QIcon(path + '')],
-                      ['Rail: 4x4 Circle Top Right', QtGui.QIcon(path + '')],
-                      ['Rail: 4x4 Circle Top Right Corner', QtGui.QIcon(path + '')],
-                      ['Rail: 4x4 Circle Upper Left Side', QtGui.QIcon(path + '')],
-                      ['Rail: 4x4 Circle Upper Right Side', QtGui.QIcon(path + '')],
-                      ['Rail: 4x4 Circle Lower Left Side', QtGui.QIcon(path + '')],
-                      ['Rail: 4x4 Circle Lower Right Side', QtGui.QIcon(path + '')],
-                      ['Rail: 4x4 Circle Bottom Left Corner', QtGui.QIcon(path + '')],
-                      ['Rail: 4x4 Circle Bottom Left', QtGui.QIcon(path + '')],
-                      ['Rail: 4x4 Circle Bottom Right', QtGui.QIcon(path + '')],
-                      ['Rail: 4x4 Circle Bottom Right Corner', QtGui.QIcon(path + '')],
-                      ['Rail: Unknown', QtGui.QIcon(path + 'Unknown.png')],
-                      ['Rail: End Stop', QtGui.QIcon(path + '')]]
-
-        ClimableGridParams = [['None', QtGui.QIcon(path + 'Core/Default.png')],
-                             ['Free Move', QtGui.QIcon(path + 'Climb/Center.png')],
-                             ['Upper Left Corner', QtGui.QIcon(path + 'Climb/UpperLeft.png')],
-                             ['Top', QtGui.QIcon(path + 'Climb/Top.png')],
-                             ['Upper Right Corner', QtGui.QIcon(path + 'Climb/UpperRight.png')],
-                             ['Left Side', QtGui.QIcon(path + 'Climb/Left.png')],
-                             ['Center', QtGui.QIcon(path + 'Climb/Center.png')],
-                             ['Right Side', QtGui.QIcon(path + 'Climb/Right.png')],
-                             ['Lower Left Corner', QtGui.QIcon(path + 'Climb/LowerLeft.png')],
-                             ['Bottom', QtGui.QIcon(path + 'Climb/Bottom.png')],
-                             ['Lower Right Corner', QtGui.QIcon(path + 'Climb/LowerRight.png')]]
-
-
-        CoinParams = [['Generic Coin', QtGui.QIcon(path + 'QBlock/Coin.png')],
-                     ['Coin', QtGui.QIcon(path + 'Unknown.png')],
-                     ['Nothing', QtGui.QIcon(path + 'Unknown.png')],
-                     ['Coin', QtGui.QIcon(path + 'Unknown.png')],
-                     ['Pow Block Coin', QtGui.QIcon(path + 'Coin/POW.png')]]
-
-        ExplodableBlockParams = [['None', QtGui.QIcon(path + 'Core/Default.png')],
-                                ['Stone Block', QtGui.QIcon(path + 'Explode/Stone.png')],
-                                ['Wooden Block', QtGui.QIcon(path + 'Explode/Wooden.png')],
-                                ['Red Block', QtGui.QIcon(path + 'Explode/Red.png')],
-                                ['Unknown', QtGui.QIcon(path + 'Unknown.png')],
-                                ['Unknown', QtGui.QIcon(path + 'Unknown.png')],
-                                ['Unknown', QtGui.QIcon(path + 'Unknown.png')]]
-
-        PipeParams = [['Vert. Top Entrance Left', QtGui.QIcon(path + 'Pipes/')],
-                      ['Vert. Top Entrance Right', QtGui.QIcon(path + '')],
-                      ['Vert. Bottom Entrance Left', QtGui.QIcon(path + '')],
-                      ['Vert. Bottom Entrance Right', QtGui.QIcon(path + '')],
-                      ['Vert. Center Left', QtGui.QIcon(path + '')],
-                      ['Vert. Center Right', QtGui.QIcon(path + '')],
-                      ['Vert. On Top Junction Left', QtGui.QIcon(path + '')],
-                      ['Vert. On Top Junction Right', QtGui.QIcon(path + '')],
-                      ['Horiz. Left Entrance Top', QtGui.QIcon(path + '')],
-                      ['Horiz. Left Entrance Bottom', QtGui.QIcon(path + '')],
-                      ['Horiz. Right Entrance Top', QtGui.QIcon(path + '')],
-                      ['Horiz. Right Entrance Bottom', QtGui.QIcon(path + '')],
-                      ['Horiz. Center Top', QtGui.QIcon(path + '')],
-                      ['Horiz. Center Bottom', QtGui.QIcon(path + '')],
-                      ['Horiz. On Top Junction Top', QtGui.QIcon(path + '')],
-                      ['Horiz. On Top Junction Bottom', QtGui.QIcon(path + '')],
-                      ['Vert. Mini Pipe Top', QtGui.QIcon(path + '')],
-                      ['Unknown', QtGui.QIcon(path + 'Unknown.png')],
-                      ['Vert. Mini Pipe Bottom', QtGui.QIcon(path + '')],
-                      ['Unknown', QtGui.QIcon(path + 'Unknown.png')],
-                      ['Unknown', QtGui.QIcon(path + 'Unknown.png')],
-                      ['Unknown', QtGui.QIcon(path + 'Unknown.png')],
-                      ['Vert. On Top Mini-Junction', QtGui.QIcon(path + '')],
-                      ['Unknown', QtGui.QIcon(path + 'Unknown.png')],
-                      ['Horiz. Mini Pipe Left', QtGui.QIcon(path + '')],
-                      ['Unknown', QtGui.QIcon(path + 'Unknown.png')],
-                      ['Horiz. Mini Pipe Right', QtGui.QIcon(path + '')],
-                      ['Unknown', QtGui.QIcon(path + 'Unknown.png')],
-                      ['Vert. Mini Pipe Center', QtGui.QIcon(path + '')],
-                      ['Horiz. Mini Pipe Center', QtGui.QIcon(path + '')],
-                      ['Horiz. On Top Mini-Junction', QtGui.QIcon(path + '')],
-                      ['Block Covered Corner', QtGui.QIcon(path + '')]]
-
-        PartialBlockParams = [['None', QtGui.QIcon(path + 'Core/Default.png')],
-                              ['Upper Left', QtGui.QIcon(path + 'Partial/UpLeft.png')],
-                              ['Upper Right', QtGui.QIcon(path + 'Partial/UpRight.png')],
-                              ['Top Half', QtGui.QIcon(path + 'Partial/TopHalf.png')],
-                              ['Lower Left', QtGui.QIcon(path + 'Partial/LowLeft.png')],
-                              ['Left Half', QtGui.QIcon(path + 'Partial/LeftHalf.png')],
-                              ['Diagonal Downwards', QtGui.QIcon(path + 'Partial/DiagDn.png')],
-                              ['Upper Left 3/4', QtGui.QIcon(path + 'Partial/UpLeft3-4.png')],
-                              ['Lower Right', QtGui.QIcon(path + 'Partial/LowRight.png')],
-                              ['Diagonal Downwards', QtGui.QIcon(path + 'Partial/DiagDn.png')],
-                              ['Right Half', QtGui.QIcon(path + 'Partial/RightHalf.png')],
-                              ['Upper Right 3/4', QtGui.QIcon(path + 'Partial/UpRig3-4.png')],
-                              ['Lower Half', QtGui.QIcon(path + 'Partial/LowHalf.png')],
-                              ['Lower Left 3/4', QtGui.QIcon(path + 'Partial/LowLeft3-4.png')],
-                              ['Lower Right 3/4', QtGui.QIcon(path + 'Partial/LowRight3-4.png')],
-                              ['Full Brick', QtGui.QIcon(path + 'Partial/Full.png')]]
-
-        SlopeParams = [['Steep Upslope', QtGui.QIcon(path + 'Slope/steepslopeleft.png')],
-                       ['Steep Downslope', QtGui.QIcon(path + 'Slope/steepsloperight.png')],
-                       ['Upslope 1', QtGui.QIcon(path + 'Slope/slopeleft.png')],
-                       ['Upslope 2', QtGui.QIcon(path + 'Slope/slope3left.png')],
-                       ['Downslope 1', QtGui.QIcon(path + 'Slope/slope3right.png')],
-                       ['Downslope 2', QtGui.QIcon(path + 'Slope/sloperight.png')],
-                       ['Steep Upslope 1', QtGui.QIcon(path + 'Slope/vsteepup1.png')],
-                       ['Steep Upslope 2', QtGui.QIcon(path + 'Slope/vsteepup2.png')],
-                       ['Steep Downslope 1', QtGui.QIcon(path + 'Slope/vsteepdown1.png')],
-                       ['Steep Downslope 2', QtGui.QIcon(path + 'Slope/vsteepdown2.png')],
-                       ['Slope Edge (solid)', QtGui.QIcon(path + 'Slope/edge.png')],
-                       ['Gentle Upslope 1', QtGui.QIcon(path + 'Slope/gentleupslope1.png')],
-                       ['Gentle Upslope 2', QtGui.QIcon(path + 'Slope/gentleupslope2.png')],
-                       ['Gentle Upslope 3', QtGui.QIcon(path + 'Slope/gentleupslope3.png')],
-                       ['Gentle Upslope 4', QtGui.QIcon(path + 'Slope/gentleupslope4.png')],
-                       ['Gentle Downslope 1', QtGui.QIcon(path + 'Slope/gentledownslope1.png')],
-                       ['Gentle Downslope 2', QtGui.QIcon(path + 'Slope/gentledownslope2.png')],
-                       ['Gentle Downslope 3', QtGui.QIcon(path + 'Slope/gentledownslope3.png')],
-                       ['Gentle Downslope 4', QtGui.QIcon(path + 'Slope/gentledownslope4.png')]]
-
-        ReverseSlopeParams = [['Steep Downslope', QtGui.QIcon(path + 'Slope/Rsteepslopeleft.png')],
-                              ['Steep Upslope', QtGui.QIcon(path + 'Slope/Rsteepsloperight.png')],
-                              ['Downslope 1', QtGui.QIcon(path + 'Slope/Rslopeleft.png')],
-                              ['Downslope 2', QtGui.QIcon(path + 'Slope/Rslope3left.png')],
-                              ['Upslope 1', QtGui.QIcon(path + 'Slope/Rslope3right.png')],
-                              ['Upslope 2', QtGui.QIcon(path + 'Slope/Rsloperight.png')],
-                              ['Steep Downslope 1', QtGui.QIcon(path + 'Slope/Rvsteepdown1.png')],
-                              ['Steep Downslope 2', QtGui.QIcon(path + 'Slope/Rvsteepdown2.png')],
-                              ['Steep Upslope 1', QtGui.QIcon(path + 'Slope/Rvsteepup1.png')],
-                              ['Steep Upslope 2', QtGui.QIcon(path + 'Slope/Rvsteepup2.png')],
-                              ['Slope Edge (solid)', QtGui.QIcon(path + 'Slope/edge.png')],
-                              ['Gentle Downslope 1', QtGui.QIcon(path + 'Slope/Rgentledownslope1.png')],
-                              ['Gentle Downslope 2', QtGui.QIcon(path + 'Slope/Rgentledownslope2.png')],
-                              ['Gentle Downslope 3', QtGui.QIcon(path + 'Slope/Rgentledownslope3.png')],
-                              ['Gentle Downslope 4', QtGui.QIcon(path + 'Slope/Rgentledownslope4.png')],
-                              ['Gentle Upslope 1', QtGui.QIcon(path + 'Slope/Rgentleupslope1.png')],
-                              ['Gentle Upslope 2', QtGui.QIcon(path + 'Slope/Rgentleupslope2.png')],
-                              ['Gentle Upslope 3', QtGui.QIcon(path + 'Slope/Rgentleupslope3.png')],
-                              ['Gentle Upslope 4', QtGui.QIcon(path + 'Slope/Rgentleupslope4.png')]]
-
-        SpikeParams = [['Double Left Spikes', QtGui.QIcon(path + 'Spike/Left.png')],
-                       ['Double Right Spikes', QtGui.QIcon(path + 'Spike/Right.png')],
-                       ['Double Upwards Spikes', QtGui.QIcon(path + 'Spike/Up.png')],
-                       ['Double Downwards Spikes', QtGui.QIcon(path + 'Spike/Down.png')],
-                       ['Long Spike Down 1', QtGui.QIcon(path + 'Spike/LongDown1.png')],
-                       ['Long Spike Down 2', QtGui.QIcon(path + 'Spike/LongDown2.png')],
-                       ['Single Downwards Spike', QtGui.QIcon(path + 'Spike/SingDown.png')],
-                       ['Spike Block', QtGui.QIcon(path + 'Unknown.png')]]
-
-        ConveyorBeltParams = [['Slow', QtGui.QIcon(path + 'Unknown.png')],
-                              ['Fast', QtGui.QIcon(path + 'Unknown.png')]]
-
-        QBlockParams = [['Fire Flower', QtGui.QIcon(path + 'Qblock/Fire.png')],
-                       ['Star', QtGui.QIcon(path + 'Qblock/Star.png')],
-                       ['Coin', QtGui.QIcon(path + 'Qblock/Coin.png')],
-                       ['Vine', QtGui.QIcon(path + 'Qblock/Vine.png')],
-                       ['1-Up', QtGui.QIcon(path + 'Qblock/1up.png')],
-                       ['Mini Mushroom', QtGui.QIcon(path + 'Qblock/Mini.png')],
-                       ['Propeller Suit', QtGui.QIcon(path + 'Qblock/Prop.png')],
-                       ['Penguin Suit', QtGui.QIcon(path + 'Qblock/Peng.png')],
-                       ['Ice Flower', QtGui.QIcon(path + 'Qblock/IceF.png')]]
-
-
-        self.ParameterList = [GenericParams,
-                              SlopeParams,
-                              ReverseSlopeParams,
-                              PartialBlockParams,
-                              CoinParams,
-                              ExplodableBlockParams,
-                              ClimableGridParams,
-                              SpikeParams,
-                              PipeParams,
-                              RailParams,
-                              ConveyorBeltParams,
-                              QBlockParams]
+        # Parameter icons are only loaded once their core type is picked
+        self.ParameterList = ParameterTypes
 
 
         layout = QtWidgets.QGridLayout()
@@ -582,11 +661,13 @@ class paletteWidget(QtWidgets.QWidget):
 
 
     def swapParams(self):
-        for item in range(12):
-            if self.coreWidgets[item].isChecked():
-                self.parameters.clear()
-                for option in self.ParameterList[item]:
-                    self.parameters.addItem(option[1], option[0])
+        item = self.coreGroup.checkedId()
+        if item == -1:
+            return
+
+        self.parameters.clear()
+        for name, icon in self.ParameterList[item]:
+            self.parameters.addItem(getIcon(icon), name)
 
 
 
@@ -617,8 +698,8 @@ class InfoBox(QtWidgets.QWidget):
 
 
         def updateAllTiles():
-            for i in range(256):
-                window.tileDisplay.update(window.tileDisplay.model().index(i, 0))
+            # One repaint of the whole view, rather than one per tile
+            window.tileDisplay.viewport().update()
         self.collisionOverlay = QtWidgets.QCheckBox('Overlay Collision')
         self.collisionOverlay.clicked.connect(updateAllTiles)
 
@@ -644,34 +725,19 @@ class InfoBox(QtWidgets.QWidget):
         self.hexdata.setFont(Font)
 
 
-        coreLayout = QtWidgets.QVBoxLayout()
-        terrLayout = QtWidgets.QVBoxLayout()
-        paramLayout = QtWidgets.QVBoxLayout()
-
-        coreLayout.setGeometry(QtCore.QRect(0,0,40,40))
-        terrLayout.setGeometry(QtCore.QRect(0,0,40,40))
-        paramLayout.setGeometry(QtCore.QRect(0,0,40,40))
-
-
-        label = QtWidgets.QLabel('Core')
-        label.setFont(Font)
-        coreLayout.addWidget(label, 0, Qt.AlignmentFlag.AlignCenter)
-
-        label = QtWidgets.QLabel('Terrain')
-        label.setFont(Font)
-        terrLayout.addWidget(label, 0, Qt.AlignmentFlag.AlignCenter)
+        def makeColumn(title, image, info):
+            """Makes a column with a title, an image and an info label"""
+            layout = QtWidgets.QVBoxLayout()
+            label = QtWidgets.QLabel(title)
+            label.setFont(Font)
+            layout.addWidget(label, 0, Qt.AlignmentFlag.AlignCenter)
+            layout.addWidget(image, 0, Qt.AlignmentFlag.AlignCenter)
+            layout.addWidget(info, 0, Qt.AlignmentFlag.AlignCenter)
+            return layout
 
-        label = QtWidgets.QLabel('Parameters')
-        label.setFont(Font)
-        paramLayout.addWidget(label, 0, Qt.AlignmentFlag.AlignCenter)
-
-        coreLayout.addWidget(self.coreImage, 0, Qt.AlignmentFlag.AlignCenter)
-        terrLayout.addWidget(self.terrainImage, 0, Qt.AlignmentFlag.AlignCenter)
-        paramLayout.addWidget(self.parameterImage, 0, Qt.AlignmentFlag.AlignCenter)
-
-        coreLayout.addWidget(self.coreInfo, 0, Qt.AlignmentFlag.AlignCenter)
-        terrLayout.addWidget(self.terrainInfo, 0, Qt.AlignmentFlag.AlignCenter)
-        paramLayout.addWidget(self.paramInfo, 0, Qt.AlignmentFlag.AlignCenter)
+        coreLayout = makeColumn('Core', self.coreImage, self.coreInfo)
+        terrLayout = makeColumn('Terrain', self.terrainImage, self.terrainInfo)
+        paramLayout = makeColumn('Parameters', self.parameterImage, self.paramInfo)
 
         imageLayout.setContentsMargins(0,4,4,4)
         imageLayout.addLayout(coreLayout)
@@ -716,31 +782,169 @@ def SetupObjectModel(self, objects, tiles):
     global Tileset
     self.clear()
 
+    # In slot 0, every tile is drawn. Otherwise, only tiles that are
+    # from this slot are
+    slotZero = (Tileset.slot == 0)
+
+    # The items are all added at once at the end, so views only get
+    # told about the new rows once
+    items = []
+
     count = 0
     for object in objects:
-        tex = QtGui.QPixmap(object.width * 24, object.height * 24)
-        tex.fill(Qt.GlobalColor.transparent)
+        # Paint into a QImage (the tiles are QImages too), and only turn
+        # the result into a pixmap for the icon
+        tex = QtGui.QImage(object.width * 24, object.height * 24, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        tex.fill(0)
         painter = QtGui.QPainter(tex)
 
-        Xoffset = 0
-        Yoffset = 0
-
-        for i in range(len(object.tiles)):
-            for tile in object.tiles[i]:
-                if (Tileset.slot == 0) or ((tile[2] & 3) != 0):
-                    painter.drawImage(Xoffset, Yoffset, tiles[tile[1]].image)
-                Xoffset += 24
-            Xoffset = 0
-            Yoffset += 24
+        for y, row in enumerate(object.tiles):
+            for x, tile in enumerate(row):
+                if slotZero or (tile[2] & 3):
+                    painter.drawImage(x * 24, y * 24, tiles[tile[1]].image)
 
         painter.end()
 
-        item = QtGui.QStandardItem(QtGui.QIcon(tex), 'Object {0}'.format(count))
+        item = QtGui.QStandardItem(QtGui.QIcon(QtGui.QPixmap.fromImage(tex)), 'Object {0}'.format(count))
         item.setEditable(False)
-        self.appendRow(item)
+        items.append(item)
 
         count += 1
 
+    self.invisibleRootItem().appendRows(items)
+
+
+# Folder the collision overlay icons are loaded from
+OverlayIconsPath = os.path.dirname(os.path.abspath(sys.argv[0])) + '/Icons/'
+
+# Collision overlay colours (without alpha) for each terrain type (byte 5)
+TerrainOverlayColours = ((64, 30, 0),       # Default (Brown?)
+                         (0, 0, 255),       # Ice
+                         (0, 0, 255),       # Snow
+                         (128, 64, 0),      # Quicksand
+                         (128, 128, 128),   # Conveyor
+                         (128, 128, 128),   # Conveyor
+                         (128, 0, 255),     # Rope
+                         (128, 0, 255),     # Half Spike
+                         (128, 0, 255),     # Ledge
+                         (128, 0, 255),     # Ladder
+                         (255, 0, 0),       # Staircase
+                         (255, 0, 0),       # Carpet
+                         (128, 64, 0),      # Dust
+                         (0, 255, 0),       # Grass
+                         (255, 0, 0),       # Unknown
+                         (128, 64, 0))      # Beach Sand
+SpikeOverlayColour = (255, 0, 0)
+
+# Overlay brushes already made, keyed by (colour, brush style)
+OverlayBrushCache = {}
+
+# Rendered tile overlays, keyed by the collision data they were drawn from
+OverlayPixmapCache = {}
+
+# Collision overlay shapes for each parameter (byte 7) value, as lists of
+# (x, y) points relative to the top-left corner of the tile
+SlopeOverlayShapes = {0: ((0, 24), (24, 24), (24, 0)),
+                      1: ((0, 0), (24, 24), (0, 24)),
+                      2: ((0, 24), (24, 24), (24, 12)),
+                      3: ((0, 24), (0, 12), (24, 0), (24, 24)),
+                      4: ((0, 24), (0, 0), (24, 12), (24, 24)),
+                      5: ((0, 12), (24, 24), (0, 24)),
+                      10: ((0, 0), (0, 24), (24, 24), (24, 0)),
+                      11: ((0, 24), (24, 18), (24, 24)),
+                      12: ((24, 24), (24, 12), (0, 18), (0, 24)),
+                      13: ((24, 24), (24, 6), (0, 12), (0, 24)),
+                      14: ((24, 24), (24, 0), (0, 6), (0, 24)),
+                      15: ((24, 24), (24, 6), (0, 0), (0, 24)),
+                      16: ((24, 24), (24, 12), (0, 6), (0, 24)),
+                      17: ((24, 24), (24, 18), (0, 12), (0, 24)),
+                      18: ((24, 24), (0, 18), (0, 24))}
+
+ReverseSlopeOverlayShapes = {0: ((0, 0), (24, 24), (24, 0)),
+                             1: ((0, 24), (0, 0), (24, 0)),
+                             2: ((24, 0), (0, 0), (24, 12)),
+                             3: ((0, 0), (0, 12), (24, 24), (24, 0)),
+                             4: ((0, 24), (0, 0), (24, 0), (24, 12)),
+                             5: ((0, 12), (0, 0), (24, 0)),
+                             10: ((0, 0), (0, 24), (24, 24), (24, 0)),
+                             11: ((0, 0), (24, 0), (24, 6)),
+                             12: ((0, 0), (24, 0), (24, 12), (0, 6)),
+                             13: ((0, 0), (24, 0), (24, 18), (0, 12)),
+                             14: ((0, 0), (24, 0), (24, 24), (0, 18)),
+                             15: ((0, 0), (24, 0), (24, 18), (0, 24)),
+                             16: ((0, 0), (24, 0), (24, 12), (0, 18)),
+                             17: ((0, 0), (24, 0), (24, 6), (0, 12)),
+                             18: ((0, 0), (24, 0), (0, 6))}
+
+PartialOverlayShapes = {1: ((0, 0), (12, 0), (12, 12), (0, 12)),
+                        2: ((12, 0), (24, 0), (24, 12), (12, 12)),
+                        3: ((0, 0), (24, 0), (24, 12), (0, 12)),
+                        4: ((0, 12), (12, 12), (12, 24), (0, 24)),
+                        5: ((0, 0), (12, 0), (12, 24), (0, 24)),
+                        6: ((0, 24), (12, 24), (12, 0), (24, 0), (24, 12), (0, 12)),
+                        7: ((0, 0), (24, 0), (24, 12), (12, 12), (12, 24), (0, 24)),
+                        8: ((12, 12), (24, 12), (24, 24), (12, 24)),
+                        9: ((24, 0), (24, 12), (0, 12), (0, 24), (12, 24), (12, 0)),
+                        10: ((12, 0), (24, 0), (24, 24), (12, 24)),
+                        11: ((0, 0), (24, 0), (24, 24), (12, 24), (12, 12), (0, 12)),
+                        12: ((0, 12), (24, 12), (24, 24), (0, 24)),
+                        13: ((0, 0), (12, 0), (12, 12), (24, 12), (24, 24), (0, 24)),
+                        14: ((24, 24), (24, 0), (12, 0), (12, 12), (0, 12), (0, 24)),
+                        15: ((0, 0), (24, 0), (24, 24), (0, 24))}
+
+# Solid-on-top and solid-on-bottom tiles are drawn as a bar and an arrow,
+# and spikes as one or two triangles, so these hold several shapes each
+SolidOnBottomOverlayShapes = (((0, 24), (24, 24), (24, 18), (0, 18)),
+                              ((15, 0), (15, 12), (18, 12), (12, 17), (6, 12), (9, 12), (9, 0)))
+
+SolidOnTopOverlayShapes = (((0, 0), (24, 0), (24, 6), (0, 6)),
+                           ((15, 24), (15, 12), (18, 12), (12, 7), (6, 12), (9, 12), (9, 24)))
+
+SpikeOverlayShapes = {0: (((24, 0), (24, 12), (0, 6)), ((24, 12), (24, 24), (0, 18))),
+                      1: (((0, 0), (0, 12), (24, 6)), ((0, 12), (0, 24), (24, 18))),
+                      2: (((0, 24), (12, 24), (6, 0)), ((12, 24), (24, 24), (18, 0))),
+                      3: (((0, 0), (12, 0), (6, 24)), ((12, 0), (24, 0), (18, 24))),
+                      4: (((0, 0), (24, 0), (18, 24), (6, 24)),),
+                      5: (((6, 0), (18, 0), (12, 24)),),
+                      6: (((0, 0), (24, 0), (12, 24)),)}
+
+
+# Overlay icons for coin, explodable and question blocks, by parameter
+# (byte 7) value, as paths relative to OverlayIconsPath
+CoinOverlayIcons = {0: 'Coin/Coin.png',
+                    4: 'Coin/POW.png'}
+
+ExplodableOverlayIcons = {1: 'Explode/Stone.png',
+                          2: 'Explode/Wood.png',
+                          3: 'Explode/Red.png'}
+
+QBlockOverlayIcons = {0: 'QBlock/FireF.png',
+                      1: 'QBlock/Star.png',
+                      2: 'QBlock/Coin.png',
+                      3: 'QBlock/Vine.png',
+                      4: 'QBlock/1up.png',
+                      5: 'QBlock/Mini.png',
+                      6: 'QBlock/Prop.png',
+                      7: 'QBlock/Peng.png',
+                      8: 'QBlock/IceF.png'}
+
+
+def overlayPolygon(shape):
+    """
+    Returns a QPolygon for one of the overlay shapes above
+    """
+    return QtGui.QPolygon([QtCore.QPoint(dx, dy) for dx, dy in shape])
+
+
+# The same shapes as QPolygons, built once and moved into place when drawn
+SlopeOverlayPolygons, ReverseSlopeOverlayPolygons, PartialOverlayPolygons = (
+    {value: overlayPolygon(shape) for value, shape in shapes.items()}
+    for shapes in (SlopeOverlayShapes, ReverseSlopeOverlayShapes, PartialOverlayShapes))
+
+SolidOnBottomOverlayPolygons = tuple(map(overlayPolygon, SolidOnBottomOverlayShapes))
+SolidOnTopOverlayPolygons = tuple(map(overlayPolygon, SolidOnTopOverlayShapes))
+SpikeOverlayPolygons = {value: tuple(map(overlayPolygon, shapes)) for value, shapes in SpikeOverlayShapes.items()}
+
 
 #############################################################################################
 ######################## List Widget with custom painter/MouseEvent #########################
@@ -791,426 +995,148 @@ class displayWidget(QtWidgets.QListView):
             """Paints an object"""
 
             global Tileset
-            p = index.model().data(index, Qt.ItemDataRole.DecorationRole)
-            painter.drawPixmap(option.rect.x(), option.rect.y(), p.pixmap(24,24))
-
             x = option.rect.x()
             y = option.rect.y()
 
+            # The model already holds each tile's pixmap, so draw that
+            # directly rather than wrapping it in a QIcon and back again
+            painter.drawPixmap(x, y, index.model().data(index, Qt.ItemDataRole.UserRole))
+
 
             # Collision Overlays
             info = window.infoDisplay
             curTile = Tileset.tiles[index.row()]
 
             if info.collisionOverlay.isChecked():
-                path = os.path.dirname(os.path.abspath(sys.argv[0])) + '/Icons/'
-
-                # Sets the colour based on terrain type
-                if curTile.byte2 & 16:      # Red
-                    colour = QtGui.QColor(255, 0, 0, 120)
-                elif curTile.byte5 == 1:    # Ice
-                    colour = QtGui.QColor(0, 0, 255, 120)
-                elif curTile.byte5 == 2:    # Snow
-                    colour = QtGui.QColor(0, 0, 255, 120)
-                elif curTile.byte5 == 3:    # Quicksand
-                    colour = QtGui.QColor(128,64,0, 120)
-                elif curTile.byte5 == 4:    # Conveyor
-                    colour = QtGui.QColor(128,128,128, 120)
-                elif curTile.byte5 == 5:    # Conveyor
-                    colour = QtGui.QColor(128,128,128, 120)
-                elif curTile.byte5 == 6:    # Rope
-                    colour = QtGui.QColor(128,0,255, 120)
-                elif curTile.byte5 == 7:    # Half Spike
-                    colour = QtGui.QColor(128,0,255, 120)
-                elif curTile.byte5 == 8:    # Ledge
-                    colour = QtGui.QColor(128,0,255, 120)
-                elif curTile.byte5 == 9:    # Ladder
-                    colour = QtGui.QColor(128,0,255, 120)
-                elif curTile.byte5 == 10:    # Staircase
-                    colour = QtGui.QColor(255, 0, 0, 120)
-                elif curTile.byte5 == 11:    # Carpet
-                    colour = QtGui.QColor(255, 0, 0, 120)
-                elif curTile.byte5 == 12:    # Dust
-                    colour = QtGui.QColor(128,64,0, 120)
-                elif curTile.byte5 == 13:    # Grass
-                    colour = QtGui.QColor(0, 255, 0, 120)
-                elif curTile.byte5 == 14:    # Unknown
-                    colour = QtGui.QColor(255, 0, 0, 120)
-                elif curTile.byte5 == 15:    # Beach Sand
-                    colour = QtGui.QColor(128, 64, 0, 120)
-                else:                       # Brown?
-                    colour = QtGui.QColor(64, 30, 0, 120)
-
-
-                # Sets Brush style for fills
-                if curTile.byte2 & 4:        # Climbing Grid
-                    style = Qt.BrushStyle.DiagCrossPattern
-                elif curTile.byte3 & 16:     # Breakable
-                    style = Qt.BrushStyle.VerPattern
+                data = curTile.data
+                # Overlays only depend on the collision data (and, for
+                # patterned brushes, where the pattern lines up), so each
+                # one is rendered once and reused for every matching tile
+                ratio = painter.device().devicePixelRatio()
+                if data[2] & 4 or data[3] & 16:
+                    phase = (x % 8, y % 8)
                 else:
-                    style = Qt.BrushStyle.SolidPattern
-
-
-                brush = QtGui.QBrush(colour, style)
-                painter.setBrush(brush)
-                painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-
-
-                # Paints shape based on other junk
-                if curTile.byte3 & 32: # Slope
-                    if curTile.byte7 == 0:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y + 24),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 24, y)]))
-                    elif curTile.byte7 == 1:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x, y + 24)]))
-                    elif curTile.byte7 == 2:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y + 24),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 24, y + 12)]))
-                    elif curTile.byte7 == 3:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y + 24),
-                                                            QtCore.QPoint(x, y + 12),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 24)]))
-                    elif curTile.byte7 == 4:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y + 24),
-                                                            QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y + 12),
-                                                            QtCore.QPoint(x + 24, y + 24)]))
-                    elif curTile.byte7 == 5:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y + 12),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x, y + 24)]))
-                    elif curTile.byte7 == 10:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x, y + 24),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 24, y)]))
-                    elif curTile.byte7 == 11:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y + 24),
-                                                            QtCore.QPoint(x + 24, y + 18),
-                                                            QtCore.QPoint(x + 24, y + 24)]))
-                    elif curTile.byte7 == 12:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 24, y + 12),
-                                                            QtCore.QPoint(x, y + 18),
-                                                            QtCore.QPoint(x, y + 24)]))
-                    elif curTile.byte7 == 13:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 24, y + 6),
-                                                            QtCore.QPoint(x, y + 12),
-                                                            QtCore.QPoint(x, y + 24)]))
-                    elif curTile.byte7 == 14:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x, y + 6),
-                                                            QtCore.QPoint(x, y + 24)]))
-                    elif curTile.byte7 == 15:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 24, y + 6),
-                                                            QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x, y + 24)]))
-                    elif curTile.byte7 == 16:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 24, y + 12),
-                                                            QtCore.QPoint(x, y + 6),
-                                                            QtCore.QPoint(x, y + 24)]))
-                    elif curTile.byte7 == 17:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 24, y + 18),
-                                                            QtCore.QPoint(x, y + 12),
-                                                            QtCore.QPoint(x, y + 24)]))
-                    elif curTile.byte7 == 18:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x, y + 18),
-                                                            QtCore.QPoint(x, y + 24)]))
-
-                elif curTile.byte3 & 64: # Reverse Slope
-                    if curTile.byte7 == 0:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 24, y)]))
-                    elif curTile.byte7 == 1:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y + 24),
-                                                            QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y)]))
-                    elif curTile.byte7 == 2:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y + 12)]))
-                    elif curTile.byte7 == 3:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x, y + 12),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 24, y)]))
-                    elif curTile.byte7 == 4:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y + 24),
-                                                            QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 12)]))
-                    elif curTile.byte7 == 5:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y + 12),
-                                                            QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y)]))
-                    elif curTile.byte7 == 10:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x, y + 24),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 24, y)]))
-                    elif curTile.byte7 == 11:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 6)]))
-                    elif curTile.byte7 == 12:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 12),
-                                                            QtCore.QPoint(x, y + 6)]))
-                    elif curTile.byte7 == 13:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 18),
-                                                            QtCore.QPoint(x, y + 12)]))
-                    elif curTile.byte7 == 14:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x, y + 18)]))
-                    elif curTile.byte7 == 15:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 18),
-                                                            QtCore.QPoint(x, y + 24)]))
-                    elif curTile.byte7 == 16:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 12),
-                                                            QtCore.QPoint(x, y + 18)]))
-                    elif curTile.byte7 == 17:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 6),
-                                                            QtCore.QPoint(x, y + 12)]))
-                    elif curTile.byte7 == 18:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x, y + 6)]))
-
-                elif curTile.byte2 & 8: # Partial
-                    if curTile.byte7 == 1:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 12, y),
-                                                            QtCore.QPoint(x + 12, y + 12),
-                                                            QtCore.QPoint(x, y + 12)]))
-                    elif curTile.byte7 == 2:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 12, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 12),
-                                                            QtCore.QPoint(x + 12, y + 12)]))
-                    elif curTile.byte7 == 3:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 12),
-                                                            QtCore.QPoint(x, y + 12)]))
-                    elif curTile.byte7 == 4:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y + 12),
-                                                            QtCore.QPoint(x + 12, y + 12),
-                                                            QtCore.QPoint(x + 12, y + 24),
-                                                            QtCore.QPoint(x, y + 24)]))
-                    elif curTile.byte7 == 5:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 12, y),
-                                                            QtCore.QPoint(x + 12, y + 24),
-                                                            QtCore.QPoint(x, y + 24)]))
-                    elif curTile.byte7 == 6:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y + 24),
-                                                            QtCore.QPoint(x + 12, y + 24),
-                                                            QtCore.QPoint(x + 12, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 12),
-                                                            QtCore.QPoint(x, y + 12)]))
-                    elif curTile.byte7 == 7:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 12),
-                                                            QtCore.QPoint(x + 12, y + 12),
-                                                            QtCore.QPoint(x + 12, y + 24),
-                                                            QtCore.QPoint(x, y + 24)]))
-                    elif curTile.byte7 == 8:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 12, y + 12),
-                                                            QtCore.QPoint(x + 24, y + 12),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 12, y + 24)]))
-                    elif curTile.byte7 == 9:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 12),
-                                                            QtCore.QPoint(x, y + 12),
-                                                            QtCore.QPoint(x, y + 24),
-                                                            QtCore.QPoint(x + 12, y + 24),
-                                                            QtCore.QPoint(x + 12, y)]))
-                    elif curTile.byte7 == 10:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 12, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 12, y + 24)]))
-                    elif curTile.byte7 == 11:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 12, y + 24),
-                                                            QtCore.QPoint(x + 12, y + 12),
-                                                            QtCore.QPoint(x, y + 12)]))
-                    elif curTile.byte7 == 12:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y + 12),
-                                                            QtCore.QPoint(x + 24, y + 12),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x, y + 24)]))
-                    elif curTile.byte7 == 13:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 12, y),
-                                                            QtCore.QPoint(x + 12, y + 12),
-                                                            QtCore.QPoint(x + 24, y + 12),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x, y + 24)]))
-                    elif curTile.byte7 == 14:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 12, y),
-                                                            QtCore.QPoint(x + 12, y + 12),
-                                                            QtCore.QPoint(x, y + 12),
-                                                            QtCore.QPoint(x, y + 24)]))
-                    elif curTile.byte7 == 15:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x, y + 24)]))
-
-                elif curTile.byte2 & 0x40: # Solid-on-bottom
-                    painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y + 24),
-                                                        QtCore.QPoint(x + 24, y + 24),
-                                                        QtCore.QPoint(x + 24, y + 18),
-                                                        QtCore.QPoint(x, y + 18)]))
-
-                    painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 15, y),
-                                                        QtCore.QPoint(x + 15, y + 12),
-                                                        QtCore.QPoint(x + 18, y + 12),
-                                                        QtCore.QPoint(x + 12, y + 17),
-                                                        QtCore.QPoint(x + 6, y + 12),
-                                                        QtCore.QPoint(x + 9, y + 12),
-                                                        QtCore.QPoint(x + 9, y)]))
-
-                elif curTile.byte2 & 0x80: # Solid-on-top
-                    painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                        QtCore.QPoint(x + 24, y),
-                                                        QtCore.QPoint(x + 24, y + 6),
-                                                        QtCore.QPoint(x, y + 6)]))
-
-                    painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 15, y + 24),
-                                                        QtCore.QPoint(x + 15, y + 12),
-                                                        QtCore.QPoint(x + 18, y + 12),
-                                                        QtCore.QPoint(x + 12, y + 7),
-                                                        QtCore.QPoint(x + 6, y + 12),
-                                                        QtCore.QPoint(x + 9, y + 12),
-                                                        QtCore.QPoint(x + 9, y + 24)]))
-
-                elif curTile.byte2 & 16: # Spikes
-                    if curTile.byte7 == 0:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 24, y + 12),
-                                                            QtCore.QPoint(x, y + 6)]))
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 24, y + 12),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x, y + 18)]))
-                    if curTile.byte7 == 1:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x, y + 12),
-                                                            QtCore.QPoint(x + 24, y + 6)]))
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y + 12),
-                                                            QtCore.QPoint(x, y + 24),
-                                                            QtCore.QPoint(x + 24, y + 18)]))
-                    if curTile.byte7 == 2:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y + 24),
-                                                            QtCore.QPoint(x + 12, y + 24),
-                                                            QtCore.QPoint(x + 6, y)]))
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 12, y + 24),
-                                                            QtCore.QPoint(x + 24, y + 24),
-                                                            QtCore.QPoint(x + 18, y)]))
-                    if curTile.byte7 == 3:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 12, y),
-                                                            QtCore.QPoint(x + 6, y + 24)]))
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 12, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 18, y + 24)]))
-                    if curTile.byte7 == 4:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 18, y + 24),
-                                                            QtCore.QPoint(x + 6, y + 24)]))
-                    if curTile.byte7 == 5:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x + 6, y),
-                                                            QtCore.QPoint(x + 18, y),
-                                                            QtCore.QPoint(x + 12, y + 24)]))
-                    if curTile.byte7 == 6:
-                        painter.drawPolygon(QtGui.QPolygon([QtCore.QPoint(x, y),
-                                                            QtCore.QPoint(x + 24, y),
-                                                            QtCore.QPoint(x + 12, y + 24)]))
-
-                elif curTile.byte3 & 2: # Coin
-                    if curTile.byte7 == 0:
-                        painter.drawPixmap(option.rect, QtGui.QPixmap(path + 'Coin/Coin.png'))
-                    if curTile.byte7 == 4:
-                        painter.drawPixmap(option.rect, QtGui.QPixmap(path + 'Coin/POW.png'))
-
-                elif curTile.byte3 & 8: # Exploder
-                    if curTile.byte7 == 1:
-                        painter.drawPixmap(option.rect, QtGui.QPixmap(path + 'Explode/Stone.png'))
-                    if curTile.byte7 == 2:
-                        painter.drawPixmap(option.rect, QtGui.QPixmap(path + 'Explode/Wood.png'))
-                    if curTile.byte7 == 3:
-                        painter.drawPixmap(option.rect, QtGui.QPixmap(path + 'Explode/Red.png'))
-
-                elif curTile.byte1 & 2: # Falling
-                    painter.drawPixmap(option.rect, QtGui.QPixmap(path + 'Prop/Fall.png'))
-
-                elif curTile.byte3 & 4: # QBlock
-                    if curTile.byte7 == 0:
-                        painter.drawPixmap(option.rect, QtGui.QPixmap(path + 'QBlock/FireF.png'))
-                    if curTile.byte7 == 1:
-                        painter.drawPixmap(option.rect, QtGui.QPixmap(path + 'QBlock/Star.png'))
-                    if curTile.byte7 == 2:
-                        painter.drawPixmap(option.rect, QtGui.QPixmap(path + 'QBlock/Coin.png'))
-                    if curTile.byte7 == 3:
-                        painter.drawPixmap(option.rect, QtGui.QPixmap(path + 'QBlock/Vine.png'))
-                    if curTile.byte7 == 4:
-                        painter.drawPixmap(option.rect, QtGui.QPixmap(path + 'QBlock/1up.png'))
-                    if curTile.byte7 == 5:
-                        painter.drawPixmap(option.rect, QtGui.QPixmap(path + 'QBlock/Mini.png'))
-                    if curTile.byte7 == 6:
-                        painter.drawPixmap(option.rect, QtGui.QPixmap(path + 'QBlock/Prop.png'))
-                    if curTile.byte7 == 7:
-                        painter.drawPixmap(option.rect, QtGui.QPixmap(path + 'QBlock/Peng.png'))
-                    if curTile.byte7 == 8:
-                        painter.drawPixmap(option.rect, QtGui.QPixmap(path + 'QBlock/IceF.png'))
-
-                elif curTile.byte3 & 1: # Solid
-                    painter.drawRect(option.rect)
-
-                else: # No fill
-                    pass
+                    phase = None
 
+                key = (data[1] & 2, data[2], data[3], data[5], data[7], phase, ratio)
+                overlay = OverlayPixmapCache.get(key)
+                if overlay is None:
+                    overlay = OverlayPixmapCache[key] = self.renderOverlay(curTile, x, y, ratio)
+
+                if not overlay.isNull():
+                    painter.drawPixmap(x - 1, y - 1, overlay)
 
-            # Highlight stuff.
-            colour = option.palette.highlight().color()
-            colour.setAlpha(80)
 
+            # Highlight stuff.
             if option.state & QtWidgets.QStyle.StateFlag.State_Selected:
+                colour = option.palette.highlight().color()
+                colour.setAlpha(80)
                 painter.fillRect(option.rect, colour)
 
 
+        def renderOverlay(self, curTile, x, y, ratio):
+            """
+            Renders the collision overlay for a tile drawn at (x, y). The
+            pixmap has a 1px margin for the shape outlines, and is null if
+            the tile has no overlay.
+            """
+            overlay = QtGui.QPixmap(QtCore.QSize(26, 26) * ratio)
+            overlay.setDevicePixelRatio(ratio)
+            overlay.fill(Qt.GlobalColor.transparent)
+
+            painter = QtGui.QPainter(overlay)
+            painter.translate(1, 1)
+            painter.setBrushOrigin(-x, -y)
+            rect = QtCore.QRect(0, 0, 24, 24)
+            path = OverlayIconsPath
+            data = curTile.data
+
+            # Sets the colour based on terrain type
+            if data[2] & 16:            # Red
+                colour = SpikeOverlayColour
+            elif data[5] < len(TerrainOverlayColours):
+                colour = TerrainOverlayColours[data[5]]
+            else:                       # Brown?
+                colour = TerrainOverlayColours[0]
+
+
+            # Sets Brush style for fills
+            if data[2] & 4:              # Climbing Grid
+                style = Qt.BrushStyle.DiagCrossPattern
+            elif data[3] & 16:           # Breakable
+                style = Qt.BrushStyle.VerPattern
+            else:
+                style = Qt.BrushStyle.SolidPattern
+
+
+            brush = OverlayBrushCache.get((colour, style))
+            if brush is None:
+                brush = OverlayBrushCache[colour, style] = QtGui.QBrush(QtGui.QColor(*colour, 120), style)
+            painter.setBrush(brush)
+            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+
+
+            # Paints shape based on other junk
+            if data[3] & 32: # Slope
+                polygon = SlopeOverlayPolygons.get(data[7])
+                if polygon is not None:
+                    painter.drawPolygon(polygon)
+
+            elif data[3] & 64: # Reverse Slope
+                polygon = ReverseSlopeOverlayPolygons.get(data[7])
+                if polygon is not None:
+                    painter.drawPolygon(polygon)
+
+            elif data[2] & 8: # Partial
+                # Partial block shapes only have horizontal and
+                # vertical edges, so they don't need antialiasing
+                painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, False)
+                polygon = PartialOverlayPolygons.get(data[7])
+                if polygon is not None:
+                    painter.drawPolygon(polygon)
+
+            elif data[2] & 0x40: # Solid-on-bottom
+                for polygon in SolidOnBottomOverlayPolygons:
+                    painter.drawPolygon(polygon)
+
+            elif data[2] & 0x80: # Solid-on-top
+                for polygon in SolidOnTopOverlayPolygons:
+                    painter.drawPolygon(polygon)
+
+            elif data[2] & 16: # Spikes
+                for polygon in SpikeOverlayPolygons.get(data[7], ()):
+                    painter.drawPolygon(polygon)
+
+            elif data[3] & 2: # Coin
+                icon = CoinOverlayIcons.get(data[7])
+                if icon is not None:
+                    painter.drawPixmap(rect, getPixmap(path + icon))
+
+            elif data[3] & 8: # Exploder
+                icon = ExplodableOverlayIcons.get(data[7])
+                if icon is not None:
+                    painter.drawPixmap(rect, getPixmap(path + icon))
+
+            elif data[1] & 2: # Falling
+                painter.drawPixmap(rect, getPixmap(path + 'Prop/Fall.png'))
+
+            elif data[3] & 4: # QBlock
+                icon = QBlockOverlayIcons.get(data[7])
+                if icon is not None:
+                    painter.drawPixmap(rect, getPixmap(path + icon))
+
+            elif data[3] & 1: # Solid
+                painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, False)
+                painter.drawRect(rect)
+
+            else: # No fill
+                painter.end()
+                return QtGui.QPixmap()
+
+            painter.end()
+            return overlay
+
+
         def sizeHint(self, option, index):
             """Returns the size for the object"""
             return QtCore.QSize(24,24)
@@ -1344,19 +1270,12 @@ class tileOverlord(QtWidgets.QWidget):
 
         width = len(object.tiles[0])-1
         height = len(object.tiles)-1
-        Xuniform = True
-        Yuniform = True
+        first = object.tiles[0][0][0]
+        Xuniform = all(tile[0] == first for tile in object.tiles[0])
+        Yuniform = all(row[0][0] == first for row in object.tiles)
         Xstretch = False
         Ystretch = False
 
-        for tile in object.tiles[0]:
-            if tile[0] != object.tiles[0][0][0]:
-                Xuniform = False
-
-        for tile in object.tiles:
-            if tile[0][0] != object.tiles[0][0][0]:
-                Yuniform = False
-
         if object.tiles[0][0][0] == object.tiles[0][width][0] and Xuniform == False:
             Xstretch = True
 
@@ -1410,33 +1329,18 @@ class tileOverlord(QtWidgets.QWidget):
 
 
         if listindex == 0: # Repeat
-            ctile = 0
-            crow = 0
-
-            for row in object.tiles:
-                for tile in row:
-                    object.tiles[crow][ctile] = (0, tile[1], tile[2])
-                    ctile += 1
-                crow += 1
-                ctile = 0
-
-            object.upperslope = [0, 0]
-            object.lowerslope = [0, 0]
-            self.tiles.slope = 0
-            self.tiles.update()
+            self.resetTiling(object)
+            self.setSlope(object, [0, 0], [0, 0], 0)
 
-        if listindex == 1: # Stretch Center
+        elif listindex == 1: # Stretch Center
 
             if object.width < 3 and object.height < 3:
                 reply = QtWidgets.QMessageBox.information(self, "Warning", "An object must be at least 3 tiles\nwide and 3 tiles tall to apply stretch center.")
                 self.setObject(index)
                 return
 
-            ctile = 0
-            crow = 0
-
-            for row in object.tiles:
-                for tile in row:
+            for crow, row in enumerate(object.tiles):
+                for ctile, tile in enumerate(row):
                     if crow == 0 and ctile == 0:
                         object.tiles[crow][ctile] = (0, tile[1], tile[2])
                     elif crow == 0 and ctile == object.width-1:
@@ -1451,229 +1355,145 @@ class tileOverlord(QtWidgets.QWidget):
                         object.tiles[crow][ctile] = (2, tile[1], tile[2])
                     else:
                         object.tiles[crow][ctile] = (3, tile[1], tile[2])
-                    ctile += 1
-                crow += 1
-                ctile = 0
 
-            object.upperslope = [0, 0]
-            object.lowerslope = [0, 0]
-            self.tiles.slope = 0
-            self.tiles.update()
+            self.setSlope(object, [0, 0], [0, 0], 0)
 
-        if listindex == 2: # Stretch X
+        elif listindex == 2: # Stretch X
 
             if object.width < 3:
                 reply = QtWidgets.QMessageBox.information(self, "Warning", "An object must be at least 3 tiles\nwide to apply stretch X.")
                 self.setObject(index)
                 return
 
-            ctile = 0
-            crow = 0
-
-            for row in object.tiles:
-                for tile in row:
+            for crow, row in enumerate(object.tiles):
+                for ctile, tile in enumerate(row):
                     if ctile == 0:
                         object.tiles[crow][ctile] = (0, tile[1], tile[2])
                     elif ctile == object.width-1:
                         object.tiles[crow][ctile] = (0, tile[1], tile[2])
                     else:
                         object.tiles[crow][ctile] = (1, tile[1], tile[2])
-                    ctile += 1
-                crow += 1
-                ctile = 0
 
-            object.upperslope = [0, 0]
-            object.lowerslope = [0, 0]
-            self.tiles.slope = 0
-            self.tiles.update()
+            self.setSlope(object, [0, 0], [0, 0], 0)
 
-        if listindex == 3: # Stretch Y
+        elif listindex == 3: # Stretch Y
 
             if object.height < 3:
                 reply = QtWidgets.QMessageBox.information(self, "Warning", "An object must be at least 3 tiles\ntall to apply stretch Y.")
                 self.setObject(index)
                 return
 
-            ctile = 0
-            crow = 0
-
-            for row in object.tiles:
-                for tile in row:
+            for crow, row in enumerate(object.tiles):
+                for ctile, tile in enumerate(row):
                     if crow == 0:
                         object.tiles[crow][ctile] = (0, tile[1], tile[2])
                     elif crow == object.height-1:
                         object.tiles[crow][ctile] = (0, tile[1], tile[2])
                     else:
                         object.tiles[crow][ctile] = (2, tile[1], tile[2])
-                    ctile += 1
-                crow += 1
-                ctile = 0
 
-            object.upperslope = [0, 0]
-            object.lowerslope = [0, 0]
-            self.tiles.slope = 0
-            self.tiles.update()
+            self.setSlope(object, [0, 0], [0, 0], 0)
 
-        if listindex == 4: # Repeat Bottom
+        elif listindex == 4: # Repeat Bottom
 
             if object.height < 2:
                 reply = QtWidgets.QMessageBox.information(self, "Warning", "An object must be at least 2 tiles\ntall to apply repeat bottom.")
                 self.setObject(index)
                 return
 
-            ctile = 0
-            crow = 0
-
-            for row in object.tiles:
-                for tile in row:
+            for crow, row in enumerate(object.tiles):
+                for ctile, tile in enumerate(row):
                     if crow == object.height-1:
                         object.tiles[crow][ctile] = (2, tile[1], tile[2])
                     else:
                         object.tiles[crow][ctile] = (0, tile[1], tile[2])
-                    ctile += 1
-                crow += 1
-                ctile = 0
 
-            object.upperslope = [0, 0]
-            object.lowerslope = [0, 0]
-            self.tiles.slope = 0
-            self.tiles.update()
+            self.setSlope(object, [0, 0], [0, 0], 0)
 
-        if listindex == 5: # Repeat Top
+        elif listindex == 5: # Repeat Top
 
             if object.height < 2:
                 reply = QtWidgets.QMessageBox.information(self, "Warning", "An object must be at least 2 tiles\ntall to apply repeat top.")
                 self.setObject(index)
                 return
 
-            ctile = 0
-            crow = 0
-
-            for row in object.tiles:
-                for tile in row:
+            for crow, row in enumerate(object.tiles):
+                for ctile, tile in enumerate(row):
                     if crow == 0:
                         object.tiles[crow][ctile] = (2, tile[1], tile[2])
                     else:
                         object.tiles[crow][ctile] = (0, tile[1], tile[2])
-                    ctile += 1
-                crow += 1
-                ctile = 0
 
-            object.upperslope = [0, 0]
-            object.lowerslope = [0, 0]
-            self.tiles.slope = 0
-            self.tiles.update()
+            self.setSlope(object, [0, 0], [0, 0], 0)
 
-        if listindex == 6: # Repeat Left
+        elif listindex == 6: # Repeat Left
 
             if object.width < 2:
                 reply = QtWidgets.QMessageBox.information(self, "Warning", "An object must be at least 2 tiles\nwide to apply repeat left.")
                 self.setObject(index)
                 return
 
-            ctile = 0
-            crow = 0
-
-            for row in object.tiles:
-                for tile in row:
+            for crow, row in enumerate(object.tiles):
+                for ctile, tile in enumerate(row):
                     if ctile == 0:
                         object.tiles[crow][ctile] = (1, tile[1], tile[2])
                     else:
                         object.tiles[crow][ctile] = (0, tile[1], tile[2])
-                    ctile += 1
-                crow += 1
-                ctile = 0
 
-            object.upperslope = [0, 0]
-            object.lowerslope = [0, 0]
-            self.tiles.slope = 0
-            self.tiles.update()
+            self.setSlope(object, [0, 0], [0, 0], 0)
 
-        if listindex == 7: # Repeat Right
+        elif listindex == 7: # Repeat Right
 
             if object.width < 2:
                 reply = QtWidgets.QMessageBox.information(self, "Warning", "An object must be at least 2 tiles\nwide to apply repeat right.")
                 self.setObject(index)
                 return
 
-            ctile = 0
-            crow = 0
-
-            for row in object.tiles:
-                for tile in row:
+            for crow, row in enumerate(object.tiles):
+                for ctile, tile in enumerate(row):
                     if ctile == object.width-1:
                         object.tiles[crow][ctile] = (1, tile[1], tile[2])
                     else:
                         object.tiles[crow][ctile] = (0, tile[1], tile[2])
-                    ctile += 1
-                crow += 1
-                ctile = 0
-
-            object.upperslope = [0, 0]
-            object.lowerslope = [0, 0]
-            self.tiles.slope = 0
-            self.tiles.update()
-
-
-        if listindex == 8: # Upward Slope
-            ctile = 0
-            crow = 0
-            for row in object.tiles:
-                for tile in row:
-                    object.tiles[crow][ctile] = (0, tile[1], tile[2])
-                    ctile += 1
-                crow += 1
-                ctile = 0
-
-            object.upperslope = [0x90, 1]
-            object.lowerslope = [0x84, object.height - 1]
-            self.tiles.slope = 1
-            self.tiles.update()
-
-        if listindex == 9: # Downward Slope
-            ctile = 0
-            crow = 0
-            for row in object.tiles:
-                for tile in row:
-                    object.tiles[crow][ctile] = (0, tile[1], tile[2])
-                    ctile += 1
-                crow += 1
-                ctile = 0
-
-            object.upperslope = [0x91, 1]
-            object.lowerslope = [0x84, object.height - 1]
-            self.tiles.slope = 1
-            self.tiles.update()
-
-        if listindex == 10: # Upward Reverse Slope
-            ctile = 0
-            crow = 0
-            for row in object.tiles:
-                for tile in row:
-                    object.tiles[crow][ctile] = (0, tile[1], tile[2])
-                    ctile += 1
-                crow += 1
-                ctile = 0
-
-            object.upperslope = [0x92, object.height - 1]
-            object.lowerslope = [0x84, 1]
-            self.tiles.slope = 0-(object.height-1)
-            self.tiles.update()
-
-        if listindex == 11: # Downward Reverse Slope
-            ctile = 0
-            crow = 0
-            for row in object.tiles:
-                for tile in row:
-                    object.tiles[crow][ctile] = (0, tile[1], tile[2])
-                    ctile += 1
-                crow += 1
-                ctile = 0
-
-            object.upperslope = [0x93, object.height - 1]
-            object.lowerslope = [0x84, 1]
-            self.tiles.slope = 0-(object.height-1)
-            self.tiles.update()
+
+            self.setSlope(object, [0, 0], [0, 0], 0)
+
+
+        elif listindex == 8: # Upward Slope
+            self.resetTiling(object)
+            self.setSlope(object, [0x90, 1], [0x84, object.height - 1], 1)
+
+        elif listindex == 9: # Downward Slope
+            self.resetTiling(object)
+            self.setSlope(object, [0x91, 1], [0x84, object.height - 1], 1)
+
+        elif listindex == 10: # Upward Reverse Slope
+            self.resetTiling(object)
+            self.setSlope(object, [0x92, object.height - 1], [0x84, 1], 0-(object.height-1))
+
+        elif listindex == 11: # Downward Reverse Slope
+            self.resetTiling(object)
+            self.setSlope(object, [0x93, object.height - 1], [0x84, 1], 0-(object.height-1))
+
+
+    def resetTiling(self, object):
+        """Sets every tile of the object back to plain repeating"""
+        for row in object.tiles:
+            row[:] = [(0, tile[1], tile[2]) for tile in row]
+
+
+    def setSlope(self, object, upperslope, lowerslope, slope):
+        """Sets the object's slope, and redraws it with that slope"""
+        object.upperslope = upperslope
+        object.lowerslope = lowerslope
+        self.tiles.slope = slope
+        self.tiles.update()
+
+
+# Shown in place of tiles that are empty or come from another tileset.
+# QImages are implicitly shared, so every such cell can use this one.
+BlankTileImage = QtGui.QImage(24, 24, QtGui.QImage.Format.Format_ARGB32)
+BlankTileImage.fill(Qt.GlobalColor.transparent)
 
 
 class tileWidget(QtWidgets.QWidget):
@@ -1681,7 +1501,8 @@ class tileWidget(QtWidgets.QWidget):
     def __init__(self):
         super().__init__()
 
-        self.tiles = []
+        self.tiles = []  # One image per tile, row by row
+        self.image = None
 
         self.size = [1, 1]
         self.setMinimumSize(24, 24)
@@ -1693,9 +1514,17 @@ class tileWidget(QtWidgets.QWidget):
         self.setAcceptDrops(True)
         self.object = 0
 
+        # For drawing the slope line and its labels
+        self.slopePen = QtGui.QPen(Qt.GlobalColor.blue)
+        self.slopePen.setWidth(1)
+        self.slopeFont = QtGui.QFont(self.font())
+        self.slopeFont.setPixelSize(8)
+        self.slopeFont.setFamily('Monaco')
+
 
     def clear(self):
         self.tiles = []
+        self.image = None
         self.size = [1, 1] # [width, height]
 
         self.slope = 0
@@ -1716,11 +1545,8 @@ class tileWidget(QtWidgets.QWidget):
         self.size[0] += 1
         self.setMinimumSize(self.size[0]*24, self.size[1]*24)
 
-        img = QtGui.QImage(24, 24, QtGui.QImage.Format.Format_ARGB32)
-        img.fill(Qt.GlobalColor.transparent)
-
         for y in range(self.size[1]):
-            self.tiles.insert(((y+1) * self.size[0]) -1, [self.size[0]-1, y, img])
+            self.tiles.insert(((y+1) * self.size[0]) -1, BlankTileImage)
 
 
         curObj = Tileset.objects[self.object]
@@ -1739,8 +1565,8 @@ class tileWidget(QtWidgets.QWidget):
         if self.size[0] == 1:
             return
 
-        for y in range(self.size[1]):
-            self.tiles.pop(((y+1) * self.size[0])-(y+1))
+        # The last cell of every row
+        del self.tiles[self.size[0]-1::self.size[0]]
 
         self.size[0] = self.size[0] - 1
         self.setMinimumSize(self.size[0]*24, self.size[1]*24)
@@ -1768,11 +1594,7 @@ class tileWidget(QtWidgets.QWidget):
         self.size[1] += 1
         self.setMinimumSize(self.size[0]*24, self.size[1]*24)
 
-        img = QtGui.QImage(24, 24, QtGui.QImage.Format.Format_ARGB32)
-        img.fill(Qt.GlobalColor.transparent)
-
-        for x in range(self.size[0]):
-            self.tiles.append([x, self.size[1]-1, img])
+        self.tiles.extend([BlankTileImage] * self.size[0])
 
         curObj = Tileset.objects[self.object]
         curObj.height += 1
@@ -1791,8 +1613,7 @@ class tileWidget(QtWidgets.QWidget):
         if self.size[1] == 1:
             return
 
-        for x in range(self.size[0]):
-            self.tiles.pop()
+        del self.tiles[-self.size[0]:]
 
         self.size[1] -= 1
         self.setMinimumSize(self.size[0]*24, self.size[1]*24)
@@ -1819,19 +1640,12 @@ class tileWidget(QtWidgets.QWidget):
             else:
                 self.slope = object.upperslope[1]
 
-        x = 0
-        y = 0
         for row in object.tiles:
             for tile in row:
                 if (Tileset.slot == 0) or ((tile[2] & 3) != 0):
-                    self.tiles.append([x, y, Tileset.tiles[tile[1]].image])
+                    self.tiles.append(Tileset.tiles[tile[1]].image)
                 else:
-                    img = QtGui.QImage(24, 24, QtGui.QImage.Format.Format_ARGB32)
-                    img.fill(Qt.GlobalColor.transparent)
-                    self.tiles.append([x, y, img])
-                x += 1
-            y += 1
-            x = 0
+                    self.tiles.append(BlankTileImage)
 
 
         self.object = window.objectList.currentIndex().row()
@@ -1839,6 +1653,12 @@ class tileWidget(QtWidgets.QWidget):
         self.updateList()
 
 
+    def upperLeft(self):
+        # The object is drawn centered in the widget
+        centerPoint = self.contentsRect().center()
+        return centerPoint.x() - self.size[0]*12, centerPoint.y() - self.size[1]*12
+
+
     def contextMenuEvent(self, event):
 
         TileMenu = QtWidgets.QMenu(self)
@@ -1862,37 +1682,37 @@ class tileWidget(QtWidgets.QWidget):
 
         currentSelected = window.tileDisplay.selectedIndexes()
 
+        width, height = self.size
+        upperLeftX, upperLeftY = self.upperLeft()
+        lowerRightX = upperLeftX + width*24
+        lowerRightY = upperLeftY + height*24
+
+        posX = event.pos().x()
+        posY = event.pos().y()
+
         ix = 0
         iy = 0
         for modelItem in currentSelected:
             # Update yourself!
-            centerPoint = self.contentsRect().center()
-
             tile = modelItem.row()
-            upperLeftX = centerPoint.x() - self.size[0]*12
-            upperLeftY = centerPoint.y() - self.size[1]*12
 
-            lowerRightX = centerPoint.x() + self.size[0]*12
-            lowerRightY = centerPoint.y() + self.size[1]*12
+            x = int((posX - upperLeftX)/24 + ix)
+            y = int((posY - upperLeftY)/24 + iy)
 
-
-            x = int((event.pos().x() - upperLeftX)/24 + ix)
-            y = int((event.pos().y() - upperLeftY)/24 + iy)
-
-            if event.pos().x() < upperLeftX or event.pos().y() < upperLeftY or event.pos().x() > lowerRightX or event.pos().y() > lowerRightY:
+            if posX < upperLeftX or posY < upperLeftY or posX > lowerRightX or posY > lowerRightY:
                 return
 
             try:
-                self.tiles[(y * self.size[0]) + x][2] = Tileset.tiles[tile].image
+                self.tiles[(y * width) + x] = Tileset.tiles[tile].image
                 Tileset.objects[self.object].tiles[y][x] = (Tileset.objects[self.object].tiles[y][x][0], tile, Tileset.slot)
             except IndexError:
                 pass
 
             ix += 1
-            if self.size[0]-1 < ix:
+            if width-1 < ix:
                 ix = 0
                 iy += 1
-            if iy > self.size[1]-1:
+            if iy > height-1:
                 break
 
 
@@ -1901,25 +1721,30 @@ class tileWidget(QtWidgets.QWidget):
         self.updateList()
 
 
-    def updateList(self):
-        # Update the list >.>
-        object = window.objmodel.itemFromIndex(window.objectList.currentIndex())
-        if not object: return
+    def updateImage(self):
+        # Draw all of the tiles into one image, so that repainting the
+        # widget and making the list icon only need to draw that
+        self.image = QtGui.QImage(self.size[0] * 24, self.size[1] * 24, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        self.image.fill(Qt.GlobalColor.transparent)
+        painter = QtGui.QPainter(self.image)
 
+        width = self.size[0]
+        for i, pix in enumerate(self.tiles):
+            y, x = divmod(i, width)
+            painter.drawImage(x * 24, y * 24, pix)
 
-        tex = QtGui.QPixmap(self.size[0] * 24, self.size[1] * 24)
-        tex.fill(Qt.GlobalColor.transparent)
-        painter = QtGui.QPainter(tex)
+        painter.end()
 
-        Xoffset = 0
-        Yoffset = 0
 
-        for tile in self.tiles:
-            painter.drawImage(tile[0]*24, tile[1]*24, tile[2])
+    def updateList(self):
+        # Everything that changes the tiles calls this afterwards
+        self.updateImage()
 
-        painter.end()
+        # Update the list >.>
+        object = window.objmodel.itemFromIndex(window.objectList.currentIndex())
+        if not object: return
 
-        object.setIcon(QtGui.QIcon(tex))
+        object.setIcon(QtGui.QIcon(QtGui.QPixmap.fromImage(self.image)))
 
         window.objectList.update()
 
@@ -1931,10 +1756,7 @@ class tileWidget(QtWidgets.QWidget):
         dlg = self.setTileDialog()
         if dlg.exec() == QtWidgets.QDialog.DialogCode.Accepted:
             # Do stuff
-            centerPoint = self.contentsRect().center()
-
-            upperLeftX = centerPoint.x() - self.size[0]*12
-            upperLeftY = centerPoint.y() - self.size[1]*12
+            upperLeftX, upperLeftY = self.upperLeft()
 
             tile = dlg.tile.value()
             tileset = dlg.tileset.currentIndex()
@@ -1943,10 +1765,7 @@ class tileWidget(QtWidgets.QWidget):
             y = int((self.contY - upperLeftY) / 24)
 
             if tileset != Tileset.slot:
-                tex = QtGui.QImage(self.size[0] * 24, self.size[1] * 24, QtGui.QImage.Format.Format_ARGB32)
-                tex.fill(Qt.GlobalColor.transparent)
-
-                self.tiles[(y * self.size[0]) + x][2] = tex
+                self.tiles[(y * self.size[0]) + x] = BlankTileImage
 
             Tileset.objects[self.object].tiles[y][x] = (Tileset.objects[self.object].tiles[y][x][0], tile, tileset)
 
@@ -1983,10 +1802,7 @@ class tileWidget(QtWidgets.QWidget):
     def setItem(self):
         global Tileset
 
-        centerPoint = self.contentsRect().center()
-
-        upperLeftX = centerPoint.x() - self.size[0]*12
-        upperLeftY = centerPoint.y() - self.size[1]*12
+        upperLeftX, upperLeftY = self.upperLeft()
 
         x = int((self.contX - upperLeftX) / 24)
         y = int((self.contY - upperLeftY) / 24)
@@ -2048,25 +1864,18 @@ class tileWidget(QtWidgets.QWidget):
         painter = QtGui.QPainter()
         painter.begin(self)
 
-        centerPoint = self.contentsRect().center()
-        upperLeftX = centerPoint.x() - self.size[0]*12
-        lowerRightX = centerPoint.x() + self.size[0]*12
-
-        upperLeftY = centerPoint.y() - self.size[1]*12
-        lowerRightY = centerPoint.y() + self.size[1]*12
+        upperLeftX, upperLeftY = self.upperLeft()
+        lowerRightX = upperLeftX + self.size[0]*24
 
 
         painter.fillRect(upperLeftX, upperLeftY, self.size[0] * 24, self.size[1]*24, QtGui.QColor(205, 205, 255))
 
-        for x, y, pix in self.tiles:
-            painter.drawImage(upperLeftX + (x * 24), upperLeftY + (y * 24), pix)
+        if self.image is None:
+            self.updateImage()
+        painter.drawImage(upperLeftX, upperLeftY, self.image)
 
         if not self.slope == 0:
-            pen = QtGui.QPen()
-#            pen.setStyle(Qt.QDashLine)
-            pen.setWidth(1)
-            pen.setColor(Qt.GlobalColor.blue)
-            painter.setPen(QtGui.QPen(pen))
+            painter.setPen(self.slopePen)
             painter.drawLine(upperLeftX, upperLeftY + (abs(self.slope) * 24), lowerRightX, upperLeftY + (abs(self.slope) * 24))
 
             if self.slope > 0:
@@ -2076,10 +1885,7 @@ class tileWidget(QtWidgets.QWidget):
                 main = 'Sub'
                 sub = 'Main'
 
-            font = painter.font()
-            font.setPixelSize(8)
-            font.setFamily('Monaco')
-            painter.setFont(font)
+            painter.setFont(self.slopeFont)
 
             painter.drawText(upperLeftX+1, upperLeftY+10, main)
             painter.drawText(upperLeftX+1, upperLeftY + (abs(self.slope) * 24) + 9, sub)
@@ -2166,8 +1972,30 @@ class PiecesModel(QtCore.QAbstractListModel):
 ################## Python-based RGB5a3 Decoding code from my BRFNT program ##################
 
 
+# NumPy takes a while to import, so it's only loaded the first time a
+# tileset image is converted (see getNumPy())
+np = None
+
+def getNumPy():
+    """
+    Returns the NumPy module, importing it on the first call. Returns
+    None if it isn't installed, in which case the pure-Python versions
+    of the conversion functions are used.
+    """
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            np = False
+        else:
+            np = numpy
+    return np or None
+
+
 RGB4A3LUT = []
 RGB4A3LUT_NoAlpha = []
+RGB4A3LUTArrays = {}  # NumPy versions of the LUTs, keyed by useAlpha
 def PrepareRGB4A3LUTs():
     global RGB4A3LUT, RGB4A3LUT_NoAlpha
 
@@ -2197,63 +2025,132 @@ def PrepareRGB4A3LUTs():
             blue = blue << 3 | blue >> 2
             LUT[d + 0x8000] = blue | (green << 8) | (red << 16) | 0xFF000000
 
-PrepareRGB4A3LUTs()
+
+def PrepareRGB4A3LUTArrays():
+    """
+    Same as PrepareRGB4A3LUTs(), but makes NumPy arrays, and works out
+    all the entries at once
+    """
+    d = np.arange(0x8000, dtype=np.uint32)
+
+    # RGB4A3
+    alpha = d >> 12
+    alpha = alpha << 5 | alpha << 2 | alpha >> 1
+    red = ((d >> 8) & 0xF) * 17
+    green = ((d >> 4) & 0xF) * 17
+    blue = (d & 0xF) * 17
+    rgb4a3 = blue | (green << 8) | (red << 16) | (alpha << 24)
+
+    # RGB555
+    red = d >> 10
+    red = red << 3 | red >> 2
+    green = (d >> 5) & 0x1F
+    green = green << 3 | green >> 2
+    blue = d & 0x1F
+    blue = blue << 3 | blue >> 2
+    rgb555 = blue | (green << 8) | (red << 16) | 0xFF000000
+
+    RGB4A3LUTArrays[True] = np.concatenate([rgb4a3, rgb555])
+    RGB4A3LUTArrays[False] = RGB4A3LUTArrays[True] | 0xFF000000
 
 
 def RGB4A3Decode(tex, useAlpha=True):
-    tx = 0; ty = 0
-    iter = tex.__iter__()
+    if getNumPy() is not None:
+        return RGB4A3DecodeNumPy(tex, useAlpha)
+
+    # All of the 16-bit texel values, 16 per 4x4 texel
+    values = struct.unpack('>262144H', tex[:0x80000])
     dest = [0] * 262144
 
-    LUT = RGB4A3LUT if useAlpha else RGB4A3LUT_NoAlpha
-
-    # Loop over all texels (of which there are 16384)
-    for i in range(16384):
-        temp1 = (i // 256) % 8
-        if temp1 == 0 or temp1 == 7:
-            # Skip every row of texels that is a multiple of 8 or (a
-            # multiple of 8) - 1
-            # Unrolled loop for performance.
-            next(iter); next(iter); next(iter); next(iter)
-            next(iter); next(iter); next(iter); next(iter)
-            next(iter); next(iter); next(iter); next(iter)
-            next(iter); next(iter); next(iter); next(iter)
-            next(iter); next(iter); next(iter); next(iter)
-            next(iter); next(iter); next(iter); next(iter)
-            next(iter); next(iter); next(iter); next(iter)
-            next(iter); next(iter); next(iter); next(iter)
-        else:
-            temp2 = i % 8
-            if temp2 == 0 or temp2 == 7:
-                # Skip every column of texels that is a multiple of 8
-                # or (a multiple of 8) - 1
-                # Unrolled loop for performance.
-                next(iter); next(iter); next(iter); next(iter)
-                next(iter); next(iter); next(iter); next(iter)
-                next(iter); next(iter); next(iter); next(iter)
-                next(iter); next(iter); next(iter); next(iter)
-                next(iter); next(iter); next(iter); next(iter)
-                next(iter); next(iter); next(iter); next(iter)
-                next(iter); next(iter); next(iter); next(iter)
-                next(iter); next(iter); next(iter); next(iter)
-            else:
-                # Actually render this texel
-                for y in range(ty, ty+4):
-                    for x in range(tx, tx+4):
-                        dest[x + y * 1024] = LUT[next(iter) << 8 | next(iter)]
+    # Only this needs the LUTs as lists, so they're made the first time
+    # it runs rather than on startup
+    if not RGB4A3LUT:
+        PrepareRGB4A3LUTs()
+    lookup = (RGB4A3LUT if useAlpha else RGB4A3LUT_NoAlpha).__getitem__
+
+    # Loop over all texels (64 rows of 256), skipping every row and
+    # column of texels that is a multiple of 8 or (a multiple of 8) - 1
+    for ty in range(64):
+        if ty % 8 == 0 or ty % 8 == 7:
+            continue
+
+        for tx in range(256):
+            if tx % 8 == 0 or tx % 8 == 7:
+                continue
 
-        # Move on to the next texel
-        tx += 4
-        if tx >= 1024: tx = 0; ty += 4
+            # Actually render this texel, one row of 4 pixels at a time
+            src = (ty * 256 + tx) * 16
+            d = ty * 4096 + tx * 4
+            dest[d:d+4] = map(lookup, values[src:src+4])
+            dest[d+1024:d+1028] = map(lookup, values[src+4:src+8])
+            dest[d+2048:d+2052] = map(lookup, values[src+8:src+12])
+            dest[d+3072:d+3076] = map(lookup, values[src+12:src+16])
 
     # Convert the list of ARGB color values into a bytes object, and
-    # then convert that into a QImage
-    return QtGui.QImage(struct.pack('<262144I', *dest), 1024, 256, QtGui.QImage.Format.Format_ARGB32)
+    # then convert that into a QImage. (array.array is much faster than
+    # struct.pack() with 262144 arguments, and Format_ARGB32 is in the
+    # native byte order anyway.)
+    return QtGui.QImage(array.array('I', dest).tobytes(), 1024, 256, QtGui.QImage.Format.Format_ARGB32)
+
+
+def RGB4A3DecodeNumPy(tex, useAlpha=True):
+    """
+    Same as RGB4A3Decode(), but converts all the texels at once with
+    NumPy instead of one at a time
+    """
+    return RGB4A3TexelsToImage(RGB4A3TexelsNumPy(tex, useAlpha))
+
+
+def RGB4A3DecodeBoth(tex):
+    """
+    Same as calling RGB4A3Decode() both with and without alpha, but only
+    converts the texels once when NumPy is available. Returns the two
+    QImages.
+    """
+    if getNumPy() is None:
+        return RGB4A3Decode(tex), RGB4A3Decode(tex, False)
+
+    texels = RGB4A3TexelsNumPy(tex, True)
+
+    # The no-alpha LUT only differs from the normal one by having every
+    # alpha value set to 0xFF
+    return RGB4A3TexelsToImage(texels), RGB4A3TexelsToImage(texels | 0xFF000000)
+
+
+def RGB4A3TexelsNumPy(tex, useAlpha):
+    """
+    Helper for the NumPy decoders: looks up the ARGB colors of all the
+    texels, as 64 rows of 256 4x4 texels
+    """
+    if not RGB4A3LUTArrays:
+        PrepareRGB4A3LUTArrays()
+    LUT = RGB4A3LUTArrays[useAlpha]
+
+    return LUT[np.frombuffer(tex, dtype='>u2', count=262144)].reshape(64, 256, 4, 4)
+
+
+def RGB4A3TexelsToImage(texels):
+    """
+    Helper for the NumPy decoders: turns a (64, 256, 4, 4) array of
+    ARGB texels into a QImage. The array is modified.
+    """
+    # Leave the same rows and columns of texels blank as RGB4A3Decode()
+    texels[0::8] = 0
+    texels[7::8] = 0
+    texels[:, 0::8] = 0
+    texels[:, 7::8] = 0
+
+    # Put each row of texels side by side to get the rows of pixels
+    dest = texels.transpose(0, 2, 1, 3).tobytes()
+    return QtGui.QImage(dest, 1024, 256, QtGui.QImage.Format.Format_ARGB32)
 
 
 def RGB4A3Encode(tex):
     assert len(tex) == (1024 * 256 * 4)
 
+    if getNumPy() is not None:
+        return RGB4A3EncodeNumPy(tex)
+
     shorts = []
     colorCache = {}
     for ytile in range(0, 256, 4):
@@ -2313,6 +2210,43 @@ def RGB4A3Encode(tex):
     return struct.pack('>262144H', *shorts)
 
 
+def RGB4A3EncodeNumPy(tex):
+    """
+    Same as RGB4A3Encode(), but converts all the pixels at once with
+    NumPy instead of one at a time
+    """
+    # The texels along the edges of each 32x32 tile only repeat their
+    # first row and column of pixels, as in RGB4A3Encode()
+    index = np.arange(1024)
+    edge = (index // 4 % 8 == 0) | (index // 4 % 8 == 7)
+    index[edge] &= ~3
+
+    pixels = np.frombuffer(tex, dtype=np.uint8).reshape(256, 1024, 4)
+    b, g, r, a = pixels[np.ix_(index[:256], index)].astype(np.uint16).transpose(2, 0, 1)
+
+    # The same channel conversions as RGB4A3Encode(). Tilesets are often
+    # entirely opaque, so each conversion is only done if any pixels
+    # need it.
+    translucent = a < 238
+    anyTranslucent = translucent.any()
+    allTranslucent = anyTranslucent and translucent.all()
+
+    if anyTranslucent:
+        rgb4a3 = ((((a + 18) << 1) // 73) << 12) | (((r + 8) // 17) << 8) | (((g + 8) // 17) << 4) | ((b + 8) // 17)
+    if not allTranslucent:
+        rgb555 = 0x8000 | ((((r + 4) << 2) // 33) << 10) | ((((g + 4) << 2) // 33) << 5) | (((b + 4) << 2) // 33)
+
+    if allTranslucent:
+        shorts = rgb4a3
+    elif not anyTranslucent:
+        shorts = rgb555
+    else:
+        shorts = np.where(translucent, rgb4a3, rgb555)
+
+    # Split the rows of pixels back up into rows of 4x4 texels
+    return shorts.reshape(64, 4, 256, 4).transpose(0, 2, 1, 3).astype('>u2').tobytes()
+
+
 #############################################################################################
 ######################### Function to fix black borders around tiles ########################
 
@@ -2332,313 +2266,448 @@ def color_transparent_pixels_around_edges_24_24(data: bytearray) -> None:
     if len(data) != 0x900:
         raise ValueError(f'expected 0x900 bytes, got {len(data):#x}')
 
-    # Redefine some globals as locals for faster lookups
-    sum_loc, len_loc, range_loc = sum, len, range
+    # Nothing to do if there aren't any fully transparent pixels
+    if 0 not in data[3::4]:
+        return
+
+    # Redefine a global as a local for faster lookups
+    range_loc = range
 
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Top-left corner
 
     if not data[0x3]:
-        neighbors = []
+        b = g = r = n = 0
 
         # (x + 1, y)
         if data[0x7]:
-            neighbors.append(data[0x4 : 0x7])
+            b += data[0x4]
+            g += data[0x5]
+            r += data[0x6]
+            n += 1
 
         # (x + 1, y + 1)
         if data[0x67]:
-            neighbors.append(data[0x64 : 0x67])
+            b += data[0x64]
+            g += data[0x65]
+            r += data[0x66]
+            n += 1
 
         # (x, y + 1)
         if data[0x63]:
-            neighbors.append(data[0x60 : 0x63])
+            b += data[0x60]
+            g += data[0x61]
+            r += data[0x62]
+            n += 1
 
-        if neighbors:
-            ln = len_loc(neighbors)
-            data[0x0] = sum_loc(n[0] for n in neighbors) // ln
-            data[0x1] = sum_loc(n[1] for n in neighbors) // ln
-            data[0x2] = sum_loc(n[2] for n in neighbors) // ln
+        if n:
+            data[0x0] = b // n
+            data[0x1] = g // n
+            data[0x2] = r // n
 
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Top-right corner
 
     if not data[0x5f]:
-        neighbors = []
+        b = g = r = n = 0
 
         # (x, y + 1)
         if data[0xbf]:
-            neighbors.append(data[0xbc : 0xbf])
+            b += data[0xbc]
+            g += data[0xbd]
+            r += data[0xbe]
+            n += 1
 
         # (x - 1, y + 1)
         if data[0xbb]:
-            neighbors.append(data[0xb8 : 0xbb])
+            b += data[0xb8]
+            g += data[0xb9]
+            r += data[0xba]
+            n += 1
 
         # (x - 1, y)
         if data[0x5b]:
-            neighbors.append(data[0x58 : 0x5b])
+            b += data[0x58]
+            g += data[0x59]
+            r += data[0x5a]
+            n += 1
 
-        if neighbors:
-            ln = len_loc(neighbors)
-            data[0x5c] = sum_loc(n[0] for n in neighbors) // ln
-            data[0x5d] = sum_loc(n[1] for n in neighbors) // ln
-            data[0x5e] = sum_loc(n[2] for n in neighbors) // ln
+        if n:
+            data[0x5c] = b // n
+            data[0x5d] = g // n
+            data[0x5e] = r // n
 
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Bottom-left corner
 
     if not data[0x8a3]:
-        neighbors = []
+        b = g = r = n = 0
 
         # (x, y - 1)
         if data[0x843]:
-            neighbors.append(data[0x840 : 0x843])
+            b += data[0x840]
+            g += data[0x841]
+            r += data[0x842]
+            n += 1
 
         # (x + 1, y - 1)
         if data[0x847]:
-            neighbors.append(data[0x844 : 0x847])
+            b += data[0x844]
+            g += data[0x845]
+            r += data[0x846]
+            n += 1
 
         # (x + 1, y)
         if data[0x8a7]:
-            neighbors.append(data[0x8a4 : 0x8a7])
+            b += data[0x8a4]
+            g += data[0x8a5]
+            r += data[0x8a6]
+            n += 1
 
-        if neighbors:
-            ln = len_loc(neighbors)
-            data[0x8a0] = sum_loc(n[0] for n in neighbors) // ln
-            data[0x8a1] = sum_loc(n[1] for n in neighbors) // ln
-            data[0x8a2] = sum_loc(n[2] for n in neighbors) // ln
+        if n:
+            data[0x8a0] = b // n
+            data[0x8a1] = g // n
+            data[0x8a2] = r // n
 
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Bottom-right corner
 
     if not data[0x8ff]:
-        neighbors = []
+        b = g = r = n = 0
 
         # (x - 1, y)
         if data[0x8fb]:
-            neighbors.append(data[0x8f8 : 0x8fb])
+            b += data[0x8f8]
+            g += data[0x8f9]
+            r += data[0x8fa]
+            n += 1
 
         # (x - 1, y - 1)
         if data[0x89b]:
-            neighbors.append(data[0x898 : 0x89b])
+            b += data[0x898]
+            g += data[0x899]
+            r += data[0x89a]
+            n += 1
 
         # (x, y - 1)
         if data[0x89f]:
-            neighbors.append(data[0x89c : 0x89f])
+            b += data[0x89c]
+            g += data[0x89d]
+            r += data[0x89e]
+            n += 1
 
-        if neighbors:
-            ln = len_loc(neighbors)
-            data[0x8fc] = sum_loc(n[0] for n in neighbors) // ln
-            data[0x8fd] = sum_loc(n[1] for n in neighbors) // ln
-            data[0x8fe] = sum_loc(n[2] for n in neighbors) // ln
+        if n:
+            data[0x8fc] = b // n
+            data[0x8fd] = g // n
+            data[0x8fe] = r // n
 
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Top edge, except corners
 
     for offset in range_loc(0x7, 0x5f, 0x4):
         if not data[offset]:
-            neighbors = []
+            b = g = r = n = 0
 
             # (x + 1, y)
-            offset += 0x4
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset + 0x4]:
+                b += data[offset + 0x1]
+                g += data[offset + 0x2]
+                r += data[offset + 0x3]
+                n += 1
 
             # (x + 1, y + 1)
-            offset += 0x60
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset + 0x64]:
+                b += data[offset + 0x61]
+                g += data[offset + 0x62]
+                r += data[offset + 0x63]
+                n += 1
 
             # (x, y + 1)
-            offset -= 0x4
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset + 0x60]:
+                b += data[offset + 0x5d]
+                g += data[offset + 0x5e]
+                r += data[offset + 0x5f]
+                n += 1
 
             # (x - 1, y + 1)
-            offset -= 0x4
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset + 0x5c]:
+                b += data[offset + 0x59]
+                g += data[offset + 0x5a]
+                r += data[offset + 0x5b]
+                n += 1
 
             # (x - 1, y)
-            offset -= 0x60
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset - 0x4]:
+                b += data[offset - 0x7]
+                g += data[offset - 0x6]
+                r += data[offset - 0x5]
+                n += 1
 
-            if neighbors:
-                ln = len_loc(neighbors)
-                data[offset + 1] = sum_loc(n[0] for n in neighbors) // ln
-                data[offset + 2] = sum_loc(n[1] for n in neighbors) // ln
-                data[offset + 3] = sum_loc(n[2] for n in neighbors) // ln
+            if n:
+                data[offset - 3] = b // n
+                data[offset - 2] = g // n
+                data[offset - 1] = r // n
 
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Bottom edge, except corners
 
     for offset in range_loc(0x8a7, 0x8ff, 0x4):
         if not data[offset]:
-            neighbors = []
+            b = g = r = n = 0
 
             # (x - 1, y)
-            offset -= 0x4
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset - 0x4]:
+                b += data[offset - 0x7]
+                g += data[offset - 0x6]
+                r += data[offset - 0x5]
+                n += 1
 
             # (x - 1, y - 1)
-            offset -= 0x60
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset - 0x64]:
+                b += data[offset - 0x67]
+                g += data[offset - 0x66]
+                r += data[offset - 0x65]
+                n += 1
 
             # (x, y - 1)
-            offset += 0x4
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset - 0x60]:
+                b += data[offset - 0x63]
+                g += data[offset - 0x62]
+                r += data[offset - 0x61]
+                n += 1
 
             # (x + 1, y - 1)
-            offset += 0x4
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset - 0x5c]:
+                b += data[offset - 0x5f]
+                g += data[offset - 0x5e]
+                r += data[offset - 0x5d]
+                n += 1
 
             # (x + 1, y)
-            offset += 0x60
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset + 0x4]:
+                b += data[offset + 0x1]
+                g += data[offset + 0x2]
+                r += data[offset + 0x3]
+                n += 1
 
-            if neighbors:
-                ln = len_loc(neighbors)
-                data[offset - 7] = sum_loc(n[0] for n in neighbors) // ln
-                data[offset - 6] = sum_loc(n[1] for n in neighbors) // ln
-                data[offset - 5] = sum_loc(n[2] for n in neighbors) // ln
+            if n:
+                data[offset - 3] = b // n
+                data[offset - 2] = g // n
+                data[offset - 1] = r // n
 
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Left edge, except corners
 
     for offset in range_loc(0x63, 0x8a3, 0x60):
         if not data[offset]:
-            neighbors = []
+            b = g = r = n = 0
 
             # (x, y - 1)
-            offset -= 0x60
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset - 0x60]:
+                b += data[offset - 0x63]
+                g += data[offset - 0x62]
+                r += data[offset - 0x61]
+                n += 1
 
             # (x + 1, y - 1)
-            offset += 0x4
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset - 0x5c]:
+                b += data[offset - 0x5f]
+                g += data[offset - 0x5e]
+                r += data[offset - 0x5d]
+                n += 1
 
             # (x + 1, y)
-            offset += 0x60
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset + 0x4]:
+                b += data[offset + 0x1]
+                g += data[offset + 0x2]
+                r += data[offset + 0x3]
+                n += 1
 
             # (x + 1, y + 1)
-            offset += 0x60
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset + 0x64]:
+                b += data[offset + 0x61]
+                g += data[offset + 0x62]
+                r += data[offset + 0x63]
+                n += 1
 
             # (x, y + 1)
-            offset -= 0x4
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset + 0x60]:
+                b += data[offset + 0x5d]
+                g += data[offset + 0x5e]
+                r += data[offset + 0x5f]
+                n += 1
 
-            if neighbors:
-                offset -= 0x63
-                ln = len_loc(neighbors)
-                data[offset] = sum_loc(n[0] for n in neighbors) // ln
-                data[offset + 1] = sum_loc(n[1] for n in neighbors) // ln
-                data[offset + 2] = sum_loc(n[2] for n in neighbors) // ln
+            if n:
+                data[offset - 3] = b // n
+                data[offset - 2] = g // n
+                data[offset - 1] = r // n
 
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Right edge, except corners
 
     for offset in range_loc(0xbf, 0x8ff, 0x60):
         if not data[offset]:
-            neighbors = []
+            b = g = r = n = 0
 
             # (x, y + 1)
-            offset += 0x60
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset + 0x60]:
+                b += data[offset + 0x5d]
+                g += data[offset + 0x5e]
+                r += data[offset + 0x5f]
+                n += 1
 
             # (x - 1, y + 1)
-            offset -= 0x4
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset + 0x5c]:
+                b += data[offset + 0x59]
+                g += data[offset + 0x5a]
+                r += data[offset + 0x5b]
+                n += 1
 
             # (x - 1, y)
-            offset -= 0x60
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset - 0x4]:
+                b += data[offset - 0x7]
+                g += data[offset - 0x6]
+                r += data[offset - 0x5]
+                n += 1
 
             # (x - 1, y - 1)
-            offset -= 0x60
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset - 0x64]:
+                b += data[offset - 0x67]
+                g += data[offset - 0x66]
+                r += data[offset - 0x65]
+                n += 1
 
             # (x, y - 1)
-            offset += 0x4
-            if data[offset]:
-                neighbors.append(data[offset - 3 : offset])
+            if data[offset - 0x60]:
+                b += data[offset - 0x63]
+                g += data[offset - 0x62]
+                r += data[offset - 0x61]
+                n += 1
 
-            if neighbors:
-                offset += 0x5d
-                ln = len_loc(neighbors)
-                data[offset] = sum_loc(n[0] for n in neighbors) // ln
-                data[offset + 1] = sum_loc(n[1] for n in neighbors) // ln
-                data[offset + 2] = sum_loc(n[2] for n in neighbors) // ln
+            if n:
+                data[offset - 3] = b // n
+                data[offset - 2] = g // n
+                data[offset - 1] = r // n
 
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     # Main body
 
     for row_start_offs in range_loc(0x67, 0x8a7, 0x60):
+        if 0 not in data[row_start_offs : row_start_offs + 0x58 : 4]:
+            continue  # (no fully transparent pixels in this row)
+        if data[row_start_offs - 0x64 : row_start_offs + 0xbc : 4].count(0) == 0x48:
+            continue  # (no non-fully-transparent pixels in this row or the ones around it)
+
         for offset in range_loc(row_start_offs, row_start_offs + 0x58, 0x4):
             if not data[offset]:  # (fully transparent pixel)
-                neighbors = []
+                b = g = r = n = 0
 
                 # (x, y - 1)
-                offset -= 0x60
-                if data[offset]:
-                    neighbors.append(data[offset - 3 : offset])
+                if data[offset - 0x60]:
+                    b += data[offset - 0x63]
+                    g += data[offset - 0x62]
+                    r += data[offset - 0x61]
+                    n += 1
 
                 # (x + 1, y - 1)
-                offset += 0x4
-                if data[offset]:
-                    neighbors.append(data[offset - 3 : offset])
+                if data[offset - 0x5c]:
+                    b += data[offset - 0x5f]
+                    g += data[offset - 0x5e]
+                    r += data[offset - 0x5d]
+                    n += 1
 
                 # (x + 1, y)
-                offset += 0x60
-                if data[offset]:
-                    neighbors.append(data[offset - 3 : offset])
+                if data[offset + 0x4]:
+                    b += data[offset + 0x1]
+                    g += data[offset + 0x2]
+                    r += data[offset + 0x3]
+                    n += 1
 
                 # (x + 1, y + 1)
-                offset += 0x60
-                if data[offset]:
-                    neighbors.append(data[offset - 3 : offset])
+                if data[offset + 0x64]:
+                    b += data[offset + 0x61]
+                    g += data[offset + 0x62]
+                    r += data[offset + 0x63]
+                    n += 1
 
                 # (x, y + 1)
-                offset -= 0x4
-                if data[offset]:
-                    neighbors.append(data[offset - 3 : offset])
+                if data[offset + 0x60]:
+                    b += data[offset + 0x5d]
+                    g += data[offset + 0x5e]
+                    r += data[offset + 0x5f]
+                    n += 1
 
                 # (x - 1, y + 1)
-                offset -= 0x4
-                if data[offset]:
-                    neighbors.append(data[offset - 3 : offset])
+                if data[offset + 0x5c]:
+                    b += data[offset + 0x59]
+                    g += data[offset + 0x5a]
+                    r += data[offset + 0x5b]
+                    n += 1
 
                 # (x - 1, y)
-                offset -= 0x60
-                if data[offset]:
-                    neighbors.append(data[offset - 3 : offset])
+                if data[offset - 0x4]:
+                    b += data[offset - 0x7]
+                    g += data[offset - 0x6]
+                    r += data[offset - 0x5]
+                    n += 1
 
                 # (x - 1, y - 1)
-                offset -= 0x60
-                if data[offset]:
-                    neighbors.append(data[offset - 3 : offset])
+                if data[offset - 0x64]:
+                    b += data[offset - 0x67]
+                    g += data[offset - 0x66]
+                    r += data[offset - 0x65]
+                    n += 1
+
+                if n:
+                    data[offset - 3] = b // n
+                    data[offset - 2] = g // n
+                    data[offset - 1] = r // n
+
+
+def color_transparent_pixels_around_edges_numpy(data: bytearray, w: int, h: int) -> None:
+    """
+    Same as color_transparent_pixels_around_edges_24_24(), but for any
+    image size, and implemented with NumPy. Used instead of the
+    generated function when NumPy is installed. "data" can also hold
+    several w x h images one after another, which are fixed separately
+    (faster than one call per image).
+
+    This is a copy of the function of the same name in
+    make_color_transparent_pixels_around_edges.py, which explains how it
+    works and checks it against the other implementations.
+    """
+    if not data or len(data) % (w * h * 4):
+        raise ValueError(f'expected a multiple of {w * h * 4:#x} bytes, got {len(data):#x}')
+
+    # This is a view of "data", so writing to it updates "data". The
+    # first axis is for when "data" holds several images.
+    arr = np.frombuffer(data, dtype=np.uint8).reshape(-1, h, w, 4)
+
+    opaque = (arr[..., 3] != 0).astype(np.uint16)
+
+    # B, G, R planes (of non-fully-transparent pixels only) and counts
+    planes = np.empty((4,) + opaque.shape, dtype=np.uint16)
+    planes[:3] = np.moveaxis(arr[..., :3], -1, 0)
+    planes[:3] *= opaque
+    planes[3] = opaque
+
+    # 3x3 box sums, as a horizontal pass and then a vertical one
+    rows = planes.copy()
+    rows[..., 1:] += planes[..., :-1]
+    rows[..., :-1] += planes[..., 1:]
+
+    box = rows.copy()
+    box[..., 1:, :] += rows[..., :-1, :]
+    box[..., :-1, :] += rows[..., 1:, :]
+
+    # Only the 8 neighbors should count, not the pixel itself
+    box -= planes
+    sums, counts = box[:3], box[3]
 
-                if neighbors:
-                    offset += 0x61
-                    ln = len_loc(neighbors)
-                    data[offset] = sum_loc(n[0] for n in neighbors) // ln
-                    data[offset + 1] = sum_loc(n[1] for n in neighbors) // ln
-                    data[offset + 2] = sum_loc(n[2] for n in neighbors) // ln
+    mask = (opaque == 0) & (counts != 0)
+    masked_counts = counts[mask]
+    for channel in range(3):
+        arr[..., channel][mask] = sums[channel][mask] // masked_counts
 
 
 #############################################################################################
@@ -2672,26 +2741,26 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tileWidget.tiles.clear()
         self.model.clear()
 
-        if self.alpha == True:
-            for tile in Tileset.tiles:
-                self.model.addPieces(QtGui.QPixmap.fromImage(tile.image))
-        else:
-            for tile in Tileset.tiles:
-                self.model.addPieces(QtGui.QPixmap.fromImage(tile.noalpha))
+        # Tiles can share an image (newTileset() gives them all the same
+        # one), so only convert each image to a pixmap once
+        pixmaps = {}
+        for tile in Tileset.tiles:
+            image = tile.image if self.alpha == True else tile.noalpha
+            pixmap = pixmaps.get(id(image))
+            if pixmap is None:
+                pixmap = pixmaps[id(image)] = QtGui.QPixmap.fromImage(image)
+            self.model.addPieces(pixmap)
 
 
     def newTileset(self):
         '''Creates a new, blank tileset'''
 
-        global Tileset
         Tileset.clear()
-        Tileset = TilesetClass()
 
         EmptyImg = QtGui.QImage(24, 24, QtGui.QImage.Format.Format_ARGB32)
         EmptyImg.fill(Qt.GlobalColor.black)
 
-        for i in range(256):
-            Tileset.addTile(EmptyImg, EmptyImg)
+        Tileset.addTiles([EmptyImg] * 256, [EmptyImg] * 256, bytes(256 * 8))
 
         self.setuptile()
         self.setWindowTitle('New Tileset')
@@ -2740,7 +2809,7 @@ class MainWindow(QtWidgets.QMainWindow):
             elif key.startswith('BG_unt/') and key.endswith('.bin'):
                 objstrings = arc[key]
             else:
-                Tileset.unknownFiles[key] = arc[key]
+                Tileset.unknownFiles.append((key, value))
 
 
         if (Image is None) or (behaviourdata is None) or (objstrings is None) or (metadata is None):
@@ -2748,8 +2817,8 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         # Stolen from Reggie! Loads the Image Data.
+        tiledata = decompressLZ(Image)
         if HaveNSMBLib:
-            tiledata = nsmblib.decompress11LZS(Image)
             if hasattr(nsmblib, 'decodeTilesetNoPremultiplication'):
                 argbdata = nsmblib.decodeTilesetNoPremultiplication(tiledata)
                 tileImage = QtGui.QImage(argbdata, 1024, 256, QtGui.QImage.Format.Format_ARGB32)
@@ -2762,34 +2831,20 @@ class MainWindow(QtWidgets.QMainWindow):
             else:
                 noalphaImage = RGB4A3Decode(tiledata, False)
         else:
-            lz = lz77.LZS11()
-            decomp = lz.Decompress11LZS(Image)
-            tileImage = RGB4A3Decode(decomp)
-            noalphaImage = RGB4A3Decode(decomp, False)
-
-        # Loads Tile Behaviours
+            tileImage, noalphaImage = RGB4A3DecodeBoth(tiledata)
 
-        behaviours = []
-        for entry in range(256):
-            behaviours.append(struct.unpack_from('>8B', behaviourdata, entry*8))
-
-
-        # Makes us some nice Tile Classes!
-        Xoffset = 4
-        Yoffset = 4
-        for i in range(256):
-            Tileset.addTile(tileImage.copy(Xoffset,Yoffset,24,24), noalphaImage.copy(Xoffset,Yoffset,24,24), behaviours[i])
-            Xoffset += 32
-            if Xoffset >= 1024:
-                Xoffset = 4
-                Yoffset += 32
+        # Makes us some nice Tile Classes! (The behaviours are read
+        # straight out of behaviourdata, 8 bytes per tile)
+        tileOffsets = [(4 + (i % 32) * 32, 4 + (i // 32) * 32) for i in range(256)]
+        Tileset.addTiles([tileImage.copy(x, y, 24, 24) for x, y in tileOffsets],
+                         [noalphaImage.copy(x, y, 24, 24) for x, y in tileOffsets],
+                         behaviourdata)
 
 
         # Load Objects
 
-        meta = []
-        for i in range(len(metadata) // 4):
-            meta.append(struct.unpack_from('>H2B', metadata, i * 4))
+        # (Offset, width, height) for each object
+        meta = list(struct.iter_unpack('>H2B', metadata[:len(metadata) // 4 * 4]))
 
         tilelist = [[]]
         upperslope = [0, 0]
@@ -2798,7 +2853,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         for entry in meta:
             offset = entry[0]
-            byte = struct.unpack_from('>B', objstrings, offset)[0]
+            byte = objstrings[offset]
             row = 0
 
             while byte != 0xFF:
@@ -2813,7 +2868,7 @@ class MainWindow(QtWidgets.QMainWindow):
                         lowerslope[1] = lowerslope[1] + 1
 
                     offset += 1
-                    byte = struct.unpack_from('>B', objstrings, offset)[0]
+                    byte = objstrings[offset]
 
                 elif (byte & 0x80):
 
@@ -2823,13 +2878,13 @@ class MainWindow(QtWidgets.QMainWindow):
                         lowerslope[0] = byte
 
                     offset += 1
-                    byte = struct.unpack_from('>B', objstrings, offset)[0]
+                    byte = objstrings[offset]
 
                 else:
-                    tilelist[len(tilelist)-1].append(struct.unpack_from('>3B', objstrings, offset))
+                    tilelist[len(tilelist)-1].append(tuple(objstrings[offset:offset+3]))
 
                     offset += 3
-                    byte = struct.unpack_from('>B', objstrings, offset)[0]
+                    byte = objstrings[offset]
 
             tilelist.pop()
 
@@ -2896,38 +2951,44 @@ class MainWindow(QtWidgets.QMainWindow):
         tileImagesRawNoAlpha = []
         tileImagesFixedNoAlpha = []
 
-        x = 0
-        y = 0
+        useNumPyEdgeFix = getNumPy() is not None
+
+        # Sets every alpha byte of a tile to 0xFF when assigned to bgra[3::4]
+        opaqueAlpha = b'\xff' * (24 * 24)
+
+        # Each tile's BGRA8 pixel data
+        tileData = []
         for i in range(256):
-            img = tileImage.copy(x*24,y*24,24,24)
+            img = tileImage.copy((i % 16) * 24, (i // 16) * 24, 24, 24)
+            tileData.append(bytearray(img.bits().asstring(24 * 24 * 4)))
 
-            bgra = bytearray(img.bits().asstring(24 * 24 * 4))
+        # The NumPy edge fix is faster when it does every tile in one go
+        if useNumPyEdgeFix and (not self.skipExtendEdgesDialog or self.extendEdges):
+            fixedData = bytearray(b''.join(tileData))
+            color_transparent_pixels_around_edges_numpy(fixedData, 24, 24)
 
+        for i, bgra in enumerate(tileData):
             # Skip this if it's not going to be used for anything
             if not self.skipExtendEdgesDialog or not self.extendEdges:
                 bgra_bk = bytearray(bgra)
 
                 tileImagesRaw.append(QtGui.QImage(bytes(bgra), 24, 24, QtGui.QImage.Format.Format_ARGB32))
-                for offs in range(3, 24 * 24 * 4, 4):
-                    bgra[offs] = 0xff
+                bgra[3::4] = opaqueAlpha
                 tileImagesRawNoAlpha.append(QtGui.QImage(bytes(bgra), 24, 24, QtGui.QImage.Format.Format_ARGB32))
 
                 bgra = bgra_bk
 
             # Ditto
             if not self.skipExtendEdgesDialog or self.extendEdges:
-                color_transparent_pixels_around_edges_24_24(bgra)
+                if useNumPyEdgeFix:
+                    bgra = fixedData[i * 0x900 : (i + 1) * 0x900]
+                else:
+                    color_transparent_pixels_around_edges_24_24(bgra)
 
                 tileImagesFixed.append(QtGui.QImage(bytes(bgra), 24, 24, QtGui.QImage.Format.Format_ARGB32))
-                for offs in range(3, 24 * 24 * 4, 4):
-                    bgra[offs] = 0xff
+                bgra[3::4] = opaqueAlpha
                 tileImagesFixedNoAlpha.append(QtGui.QImage(bytes(bgra), 24, 24, QtGui.QImage.Format.Format_ARGB32))
 
-            x += 1
-            if x >= 16:
-                y += 1
-                x = 0
-
         # Show dialog if needed
         if not self.skipExtendEdgesDialog:
             fullRaw = QtGui.QImage(384, 384, QtGui.QImage.Format.Format_ARGB32)
@@ -2956,13 +3017,13 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Apply new tile images
         if self.extendEdges:
-            for i in range(256):
-                Tileset.tiles[i].image = tileImagesFixed[i]
-                Tileset.tiles[i].noalpha = tileImagesFixedNoAlpha[i]
+            images, noalphas = tileImagesFixed, tileImagesFixedNoAlpha
         else:
-            for i in range(256):
-                Tileset.tiles[i].image = tileImagesRaw[i]
-                Tileset.tiles[i].noalpha = tileImagesRawNoAlpha[i]
+            images, noalphas = tileImagesRaw, tileImagesRawNoAlpha
+
+        for tile, image, noalpha in zip(Tileset.tiles, images, noalphas):
+            tile.image = image
+            tile.noalpha = noalpha
 
         self.setuptile()
 
@@ -3150,36 +3211,12 @@ class MainWindow(QtWidgets.QMainWindow):
 
 
     def PackTexture(self):
+        global NSMBLibCompressionWorking
 
-        tex = bytearray(1024 * 256 * 4)
-        stride = 1024 * 4
-
-        for i, tile in enumerate(Tileset.tiles):
-            tile_bytes = bytearray(tile.image.bits().asstring(24 * 24 * 4))
-
-            row, col = divmod(i, 32)
-            dest_offs = row * 32 * stride + col * (32 * 4)
-
-            for src_y in range(24):
-                row = tile_bytes[src_y * (24 * 4) : (src_y + 1) * (24 * 4)]
-
-                # Clamp left/right pixels of the row
-                row = row[:4] * 4 + row + row[-4:] * 4
-
-                tex[dest_offs : dest_offs + (32 * 4)] = row
-                dest_offs += stride
-                if src_y == 0 or src_y == 23:
-                    # Clamp top/bottom rows of the tile
-                    tex[dest_offs : dest_offs + (32 * 4)] = row
-                    dest_offs += stride
-                    tex[dest_offs : dest_offs + (32 * 4)] = row
-                    dest_offs += stride
-                    tex[dest_offs : dest_offs + (32 * 4)] = row
-                    dest_offs += stride
-                    tex[dest_offs : dest_offs + (32 * 4)] = row
-                    dest_offs += stride
-
-        tex = bytes(tex)
+        if getNumPy() is not None:
+            tex = self.PackTextureAtlasNumPy()
+        else:
+            tex = self.PackTextureAtlas()
 
         tex = RGB4A3Encode(tex)
 
@@ -3195,10 +3232,12 @@ class MainWindow(QtWidgets.QMainWindow):
 
             # The original broken algorithm compresses that incorrectly.
             # So let's compress it, and then decompress it, and see if we
-            # got the right output.
-            compressionWorking = (nsmblib.decompress11LZS(nsmblib.compress11LZS(COMPRESSION_TEST)) == COMPRESSION_TEST)
+            # got the right output. (This can't change while Puzzle is
+            # running, so it's only done once.)
+            if NSMBLibCompressionWorking is None:
+                NSMBLibCompressionWorking = (nsmblib.decompress11LZS(nsmblib.compress11LZS(COMPRESSION_TEST)) == COMPRESSION_TEST)
 
-            if not compressionWorking:
+            if not NSMBLibCompressionWorking:
                 # NSMBLib is available, but only with the broken compression algorithm,
                 # so the user can choose whether to use it or not
 
@@ -3231,20 +3270,69 @@ class MainWindow(QtWidgets.QMainWindow):
             return lz77.LZS11().Compress11LZS(tex)
 
 
+    def PackTextureAtlas(self):
+        '''Lays the tiles out 32 to a row, padding each one out to 32x32 by
+        repeating its edge pixels, as BGRA8 pixel data for RGB4A3Encode()'''
+
+        tex = bytearray(1024 * 256 * 4)
+        stride = 1024 * 4
+
+        for i, tile in enumerate(Tileset.tiles):
+            tile_bytes = tile.image.constBits().asstring(24 * 24 * 4)
+
+            row, col = divmod(i, 32)
+            dest_offs = row * 32 * stride + col * (32 * 4)
+
+            for src_y in range(24):
+                row = tile_bytes[src_y * (24 * 4) : (src_y + 1) * (24 * 4)]
+
+                # Clamp left/right pixels of the row
+                row = row[:4] * 4 + row + row[-4:] * 4
+
+                tex[dest_offs : dest_offs + (32 * 4)] = row
+                dest_offs += stride
+                if src_y == 0 or src_y == 23:
+                    # Clamp top/bottom rows of the tile
+                    tex[dest_offs : dest_offs + (32 * 4)] = row
+                    dest_offs += stride
+                    tex[dest_offs : dest_offs + (32 * 4)] = row
+                    dest_offs += stride
+                    tex[dest_offs : dest_offs + (32 * 4)] = row
+                    dest_offs += stride
+                    tex[dest_offs : dest_offs + (32 * 4)] = row
+                    dest_offs += stride
+
+        return bytes(tex)
+
+
+    def PackTextureAtlasNumPy(self):
+        '''Same as PackTextureAtlas(), but pads and arranges all of the
+        tiles at once with NumPy'''
+
+        tiles = np.frombuffer(b''.join(tile.image.constBits().asstring(24 * 24 * 4) for tile in Tileset.tiles),
+                              dtype=np.uint8).reshape(-1, 24, 24, 4)
+
+        atlas = np.zeros((256, 32, 32, 4), dtype=np.uint8)
+        atlas[:len(tiles)] = np.pad(tiles, ((0, 0), (4, 4), (4, 4), (0, 0)), mode='edge')
+
+        # 8 rows of 32 tiles each
+        return atlas.reshape(8, 32, 32, 32, 4).transpose(0, 2, 1, 3, 4).tobytes()
+
+
     def PackTiles(self):
-        offset = 0
-        tilespack = struct.Struct('>8B')
-        Tilebuffer = create_string_buffer(2048)
-        for tile in Tileset.tiles:
-            tilespack.pack_into(Tilebuffer, offset, tile.byte0, tile.byte1, tile.byte2, tile.byte3, tile.byte4, tile.byte5, tile.byte6, tile.byte7)
-            offset += 8
+        tiledata = b''.join(tile.data for tile in Tileset.tiles)
 
-        return Tilebuffer.raw
+        # The behaviour table is always 2048 bytes, padded with zeroes
+        return tiledata.ljust(2048, b'\0')
 
 
     def PackObjects(self):
         objectStrings = []
 
+        def packRows(rows):
+            # Each tile is 3 bytes, and each row ends with 0xFE
+            return b''.join(bytes([value for tile in row for value in tile]) + b'\xfe' for row in rows)
+
         o = 0
         for object in Tileset.objects:
 
@@ -3263,18 +3351,12 @@ class MainWindow(QtWidgets.QMainWindow):
                         iterationsA = object.upperslope[1]
                         iterationsB = object.lowerslope[1] + object.upperslope[1]
 
-                    for row in range(iterationsA, iterationsB):
-                        for tile in object.tiles[row]:
-                            a = a + struct.pack('>BBB', tile[0], tile[1], tile[2])
-                        a = a + b'\xfe'
+                    a = a + packRows(object.tiles[row] for row in range(iterationsA, iterationsB))
 
                     if object.height > 1:
                         a = a + struct.pack('>B', object.lowerslope[0])
 
-                        for row in range(0, object.upperslope[1]):
-                            for tile in object.tiles[row]:
-                                a = a + struct.pack('>BBB', tile[0], tile[1], tile[2])
-                            a = a + b'\xfe'
+                        a = a + packRows(object.tiles[row] for row in range(0, object.upperslope[1]))
 
                     a = a + b'\xff'
 
@@ -3285,18 +3367,12 @@ class MainWindow(QtWidgets.QMainWindow):
                 else:
                     a = struct.pack('>B', object.upperslope[0])
 
-                    for row in range(0, object.upperslope[1]):
-                        for tile in object.tiles[row]:
-                            a = a + struct.pack('>BBB', tile[0], tile[1], tile[2])
-                        a = a + b'\xfe'
+                    a = a + packRows(object.tiles[row] for row in range(0, object.upperslope[1]))
 
                     if object.height > 1:
                         a = a + struct.pack('>B', object.lowerslope[0])
 
-                        for row in range(object.upperslope[1], object.height):
-                            for tile in object.tiles[row]:
-                                a = a + struct.pack('>BBB', tile[0], tile[1], tile[2])
-                            a = a + b'\xfe'
+                        a = a + packRows(object.tiles[row] for row in range(object.upperslope[1], object.height))
 
                     a = a + b'\xff'
 
@@ -3305,30 +3381,21 @@ class MainWindow(QtWidgets.QMainWindow):
 
             # Not slopes!
             else:
-                a = b''
-
-                for tilerow in object.tiles:
-                    for tile in tilerow:
-                        a = a + struct.pack('>BBB', tile[0], tile[1], tile[2])
-
-                    a = a + b'\xfe'
-
-                a = a + b'\xff'
+                a = packRows(object.tiles) + b'\xff'
 
                 objectStrings.append(a)
 
             o += 1
 
-        Objbuffer = b''
-        Metabuffer = b''
-        i = 0
-        for a in objectStrings:
-            Metabuffer = Metabuffer + struct.pack('>H2B', len(Objbuffer), Tileset.objects[i].width, Tileset.objects[i].height)
-            Objbuffer = Objbuffer + a
-
-            i += 1
+        # Each object's metadata is its offset in the object strings, and
+        # its size
+        Metabuffer = []
+        offset = 0
+        for object, a in zip(Tileset.objects, objectStrings):
+            Metabuffer.append(struct.pack('>H2B', offset, object.width, object.height))
+            offset += len(a)
 
-        return (Objbuffer, Metabuffer)
+        return (b''.join(objectStrings), b''.join(Metabuffer))
 
 
 
@@ -3384,7 +3451,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         pyVerAct = fileMenu.addAction('Using Python %d.%d.%d' % sys.version_info[:3])
         pyVerAct.setEnabled(False)
-        bindingsVerAct = fileMenu.addAction('Using %s %d.%d.%d' % (QtName, QtBindingsVersion[0], QtBindingsVersion[1], QtBindingsVersion[2]))
+        bindingsVerAct = fileMenu.addAction('Using %s %d.%d.%d' % (QtName, *QtBindingsVersion))
         bindingsVerAct.setEnabled(False)
         qtVerAct = fileMenu.addAction('Using Qt %d.%d.%d' % QtCompatVersion)
         qtVerAct.setEnabled(False)
@@ -3412,22 +3479,12 @@ class MainWindow(QtWidgets.QMainWindow):
             self.tileWidget.tilesetType.setText(item)
 
 
-            cobj = 0
-            crow = 0
-            ctile = 0
+            # Blank tiles are left alone, except at the start of a row
             for object in Tileset.objects:
                 for row in object.tiles:
-                    for tile in row:
-                        if tile != (0,0,0):
-                            Tileset.objects[cobj].tiles[crow][ctile] = (tile[0], tile[1], (tile[2] & 0xFC) | int(str(item[2])))
-                        if tile == (0,0,0) and ctile == 0:
-                            Tileset.objects[cobj].tiles[crow][ctile] = (tile[0], tile[1], (tile[2] & 0xFC) | int(str(item[2])))
-                        ctile += 1
-                    crow += 1
-                    ctile = 0
-                cobj += 1
-                crow = 0
-                ctile = 0
+                    for x, tile in enumerate(row):
+                        if x == 0 or tile != (0,0,0):
+                            row[x] = (tile[0], tile[1], (tile[2] & 0xFC) | Tileset.slot)
 
 
     def toggleAlpha(self):
@@ -3461,15 +3518,9 @@ class MainWindow(QtWidgets.QMainWindow):
     def clearCollisions(self):
         '''Clears the collisions data'''
 
+        blankData = bytes(8)
         for tile in Tileset.tiles:
-            tile.byte0 = 0
-            tile.byte1 = 0
-            tile.byte2 = 0
-            tile.byte3 = 0
-            tile.byte4 = 0
-            tile.byte5 = 0
-            tile.byte6 = 0
-            tile.byte7 = 0
+            tile.data[:] = blankData
 
         self.updateInfo(0, 0)
         self.tileDisplay.update()
@@ -3527,6 +3578,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         index = [self.tileDisplay.indexAt(QtCore.QPoint(x, y))]
         curTile = Tileset.tiles[index[0].row()]
+        data = curTile.data
         info = self.infoDisplay
         palette = self.paletteWidget
 
@@ -3534,42 +3586,42 @@ class MainWindow(QtWidgets.QMainWindow):
         propertyText = ''
         coreType = 0
 
-        if curTile.byte3 & 32:
+        if data[3] & 32:
             coreType = 1
-        elif curTile.byte3 & 64:
+        elif data[3] & 64:
             coreType = 2
-        elif curTile.byte2 & 8:
+        elif data[2] & 8:
             coreType = 3
-        elif curTile.byte3 & 2:
+        elif data[3] & 2:
             coreType = 4
-        elif curTile.byte3 & 8:
+        elif data[3] & 8:
             coreType = 5
-        elif curTile.byte2 & 4:
+        elif data[2] & 4:
             coreType = 6
-        elif curTile.byte2 & 16:
+        elif data[2] & 16:
             coreType = 7
-        elif curTile.byte1 & 1:
+        elif data[1] & 1:
             coreType = 8
-        elif 0 > curTile.byte7 > 0x23:
+        elif 0 > data[7] > 0x23:
             coretype = 9
-        elif curTile.byte5 == 4 or 5:
+        elif data[5] == 4 or 5:
             coretype = 10
-        elif curTile.byte3 & 4:
+        elif data[3] & 4:
             coreType = 11
 
-        if curTile.byte3 & 1:
+        if data[3] & 1:
             propertyList.append('Solid')
-        if curTile.byte3 & 16:
+        if data[3] & 16:
             propertyList.append('Breakable')
-        if curTile.byte2 & 128:
+        if data[2] & 128:
             propertyList.append('Pass-Through')
-        if curTile.byte2 & 64:
+        if data[2] & 64:
             propertyList.append('Pass-Down')
-        if curTile.byte1 & 2:
+        if data[1] & 2:
             propertyList.append('Falling')
-        if curTile.byte1 & 8:
+        if data[1] & 8:
             propertyList.append('Ledge')
-        if curTile.byte0 & 2:
+        if data[0] & 2:
             propertyList.append('Meltable')
 
 
@@ -3583,30 +3635,30 @@ class MainWindow(QtWidgets.QMainWindow):
                 propertyText = propertyText + ', ' + string
 
         if coreType == 0:
-            if curTile.byte7 == 0x23:
+            if data[7] == 0x23:
                 parameter = palette.ParameterList[coreType][1]
-            elif curTile.byte7 == 0x28:
+            elif data[7] == 0x28:
                 parameter = palette.ParameterList[coreType][2]
-            elif curTile.byte7 >= 0x35:
-                parameter = palette.ParameterList[coreType][curTile.byte7 - 0x32]
+            elif data[7] >= 0x35:
+                parameter = palette.ParameterList[coreType][data[7] - 0x32]
             else:
                 parameter = palette.ParameterList[coreType][0]
         else:
-            parameter = palette.ParameterList[coreType][curTile.byte7]
+            parameter = palette.ParameterList[coreType][data[7]]
 
 
-        info.coreImage.setPixmap(palette.coreTypes[coreType][1].pixmap(24,24))
-        info.terrainImage.setPixmap(palette.terrainTypes[curTile.byte5][1].pixmap(24,24))
-        info.parameterImage.setPixmap(parameter[1].pixmap(24,24))
+        info.coreImage.setPixmap(getIcon(palette.coreTypes[coreType][1]).pixmap(24,24))
+        info.terrainImage.setPixmap(getIcon(palette.terrainTypes[data[5]][1]).pixmap(24,24))
+        info.parameterImage.setPixmap(getIcon(parameter[1]).pixmap(24,24))
 
         info.coreInfo.setText(palette.coreTypes[coreType][0])
         info.propertyInfo.setText(propertyText)
-        info.terrainInfo.setText(palette.terrainTypes[curTile.byte5][0])
+        info.terrainInfo.setText(palette.terrainTypes[data[5]][0])
         info.paramInfo.setText(parameter[0])
 
         info.hexdata.setText('Hex Data: {0} {1} {2} {3}\n                {4} {5} {6} {7}'.format(
-                                hex(curTile.byte0), hex(curTile.byte1), hex(curTile.byte2), hex(curTile.byte3),
-                                hex(curTile.byte4), hex(curTile.byte5), hex(curTile.byte6), hex(curTile.byte7)))
+                                hex(data[0]), hex(data[1]), hex(data[2]), hex(data[3]),
+                                hex(data[4]), hex(data[5]), hex(data[6]), hex(data[7])))
 
 
 
@@ -3615,50 +3667,49 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         curTile = Tileset.tiles[index.row()]
+        data = curTile.data
         palette = self.paletteWidget
 
-        if palette.coreWidgets[8].isChecked() == 1 or palette.propertyWidgets[0].isChecked() == 1:
+        # Read each checkbox once
+        core = [widget.isChecked() for widget in palette.coreWidgets]
+        props = [widget.isChecked() for widget in palette.propertyWidgets]
+
+        if core[8] or props[0]:
             solid = 1
         else:
             solid = 0
 
-        if palette.coreWidgets[1].isChecked() == 1 or palette.coreWidgets[2].isChecked() == 1:
+        if core[1] or core[2]:
             solid = 0
 
 
-        curTile.byte0 = ((palette.propertyWidgets[4].isChecked() << 1))
-        curTile.byte1 = ((palette.coreWidgets[8].isChecked()) +
-                        (palette.propertyWidgets[2].isChecked() << 1) +
-                        (palette.propertyWidgets[3].isChecked() << 3))
-        curTile.byte2 = ((palette.coreWidgets[6].isChecked() << 2) +
-                        (palette.coreWidgets[3].isChecked() << 3) +
-                        (palette.coreWidgets[7].isChecked() << 4) +
-                        (palette.PassDown.isChecked() << 6) +
-                        (palette.PassThrough.isChecked() << 7))
-        curTile.byte3 = ((solid) +
-                        (palette.coreWidgets[4].isChecked() << 1) +
-                        (palette.coreWidgets[5].isChecked() << 3) +
-                        (palette.propertyWidgets[1].isChecked() << 4) +
-                        (palette.coreWidgets[1].isChecked() << 5) +
-                        (palette.coreWidgets[2].isChecked() << 6) +
-                        (palette.coreWidgets[11].isChecked() << 2))
-        curTile.byte4 = 0
-        if palette.coreWidgets[2].isChecked():
-            curTile.byte5 = 4
-        curTile.byte5 = palette.terrainType.currentIndex()
-
-        if palette.coreWidgets[0].isChecked():
-            params = palette.parameters.currentIndex()
-            if params == 0:
-                curTile.byte7 = 0
-            elif params == 1:
-                curTile.byte7 = 0x23
-            elif params == 2:
-                curTile.byte7 = 0x28
-            elif params >= 3:
-                curTile.byte7 = params + 0x32
+        data[0] = ((props[4] << 1))
+        data[1] = ((core[8]) +
+                  (props[2] << 1) +
+                  (props[3] << 3))
+        data[2] = ((core[6] << 2) +
+                  (core[3] << 3) +
+                  (core[7] << 4) +
+                  (palette.PassDown.isChecked() << 6) +
+                  (palette.PassThrough.isChecked() << 7))
+        data[3] = ((solid) +
+                  (core[4] << 1) +
+                  (core[5] << 3) +
+                  (props[1] << 4) +
+                  (core[1] << 5) +
+                  (core[2] << 6) +
+                  (core[11] << 2))
+        data[4] = 0
+        data[5] = palette.terrainType.currentIndex()
+
+        params = palette.parameters.currentIndex()
+        if core[0]:
+            if 0 <= params < len(GenericParamBytes):
+                data[7] = GenericParamBytes[params]
+            elif params >= len(GenericParamBytes):
+                data[7] = params + 0x32
         else:
-            curTile.byte7 = palette.parameters.currentIndex()
+            data[7] = params
 
         self.updateInfo(0, 0)
         self.tileDisplay.update()
@@ -3673,6 +3724,10 @@ if '-nolib' in sys.argv:
     HaveNSMBLib = False
     sys.argv.remove('-nolib')
 
+if '-numba' in sys.argv:
+    lz77.UseNumba = True
+    sys.argv.remove('-numba')
+
 if __name__ == '__main__':
 
     import sys